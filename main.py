@@ -23,6 +23,11 @@ from src.common.config import load_config, Config
 from src.common.models import ReservationTarget, ReservationStatus
 from src.common.scheduler import PrecisionScheduler
 
+try:
+    import uvloop
+except ImportError:  # optional, faster event loop for every command
+    uvloop = None
+
 console = Console()
 
 
@@ -52,6 +57,10 @@ def cli(ctx, config, verbose):
     """
     ctx.ensure_object(dict)
     
+    # Every command runs through asyncio.run(); use uvloop's loop when installed
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         cfg = load_config(config)
         ctx.obj["config"] = cfg
@@ -141,7 +150,7 @@ def browser_now(ctx):
             departure_date=cfg.target.departure.date()
         )
         
-        async with RecGovBrowserBot(cfg) as bot:
+        async with RecGovBrowserBot(cfg, race_mode=True) as bot:
             result = await bot.attempt_reservation(target)
             
             if result.status == ReservationStatus.IN_CART:
@@ -250,7 +259,7 @@ def browser_quick(ctx):
             departure_date=departure_date
         )
         
-        async with RecGovBrowserBot(cfg) as bot:
+        async with RecGovBrowserBot(cfg, race_mode=True) as bot:
             result = await bot.attempt_reservation(target)
             
             if result.status == ReservationStatus.IN_CART:
@@ -304,7 +313,7 @@ def browser_snipe(ctx):
             style="red"
         ))
         
-        async with RecGovBrowserBot(cfg) as bot:
+        async with RecGovBrowserBot(cfg, race_mode=True) as bot:
             # Phase 1: Login
             console.print("\n[bold cyan]Phase 1: Login[/bold cyan]")
             if not await bot._is_logged_in():
@@ -470,7 +479,7 @@ def browser_schedule(ctx):
             departure_date=cfg.target.departure.date()
         )
         
-        async with RecGovBrowserBot(cfg) as bot:
+        async with RecGovBrowserBot(cfg, race_mode=True) as bot:
             result = await bot.run_scheduled(target)
             
             if result.status == ReservationStatus.IN_CART:
@@ -539,8 +548,12 @@ def api_check(ctx):
 
 
 @legacy_api.command("reserve")
+@click.option(
+    "--wait-for-window", is_flag=True,
+    help="Log in and prefetch availability, then attempt when the window opens"
+)
 @click.pass_context
-def api_reserve(ctx):
+def api_reserve(ctx, wait_for_window):
     """Attempt reservation via API"""
     from src.legacy.api import RecGovAPIClient
     
@@ -549,21 +562,31 @@ def api_reserve(ctx):
     async def run():
         console.print(Panel("🚀 Attempting Reservation via API", style="green"))
         
+        target = ReservationTarget(
+            campground_id=cfg.target.campground_id,
+            campsite_ids=cfg.target.campsite_ids,
+            arrival_date=cfg.target.arrival.date(),
+            departure_date=cfg.target.departure.date()
+        )
+        
         async with RecGovAPIClient(cfg) as client:
-            # Login first
-            if not await client.login():
+            if wait_for_window:
+                # Login overlaps the wait; availability is fetched just
+                # before the window so the cart burst starts on time
+                console.print(
+                    f"[yellow]Waiting for window at {cfg.schedule.window_datetime} "
+                    f"(logging in and prefetching availability first)...[/yellow]"
+                )
+                logged_in = await client.prewarm(target)
+            else:
+                logged_in = await client.login()
+            
+            if not logged_in:
                 console.print("[red]Login failed![/red]")
                 return
             
             console.print("[green]✓ Logged in[/green]")
             
-            target = ReservationTarget(
-                campground_id=cfg.target.campground_id,
-                campsite_ids=cfg.target.campsite_ids,
-                arrival_date=cfg.target.arrival.date(),
-                departure_date=cfg.target.departure.date()
-            )
-            
             result = await client.attempt_reservation(target)
             
             if result.status == ReservationStatus.IN_CART:
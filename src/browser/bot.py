@@ -6,7 +6,8 @@ More reliable than direct API but slower.
 """
 import asyncio
 import logging
-from datetime import datetime, date
+import re
+from datetime import datetime, date, timedelta
 from typing import Optional, List, Callable, Awaitable
 from pathlib import Path
 
@@ -35,6 +36,11 @@ from ..common.scheduler import PrecisionScheduler, RetryStrategy
 
 logger = logging.getLogger(__name__)
 
+_TIMER_MINUTES_RE = re.compile(r'(\d+)\s*min')
+
+# How long Recreation.gov holds a site in the cart
+_CART_TTL = timedelta(minutes=15)
+
 
 class RecGovBrowserBot:
     """
@@ -45,10 +51,14 @@ class RecGovBrowserBot:
     - Handles JavaScript-rendered content
     - Can pause for CAPTCHA human intervention
     - Provides seamless session handoff
+    
+    Set race_mode for time-critical runs (scheduled/immediate attempts):
+    it disables the configured slow_mo so every action runs at full speed.
     """
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, race_mode: bool = False):
         self.config = config
+        self.race_mode = race_mode
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
@@ -56,10 +66,17 @@ class RecGovBrowserBot:
         self.session = BrowserSession(config.browser.session_file)
         self.notifications = NotificationManager(config.notifications)
         self.scheduler = PrecisionScheduler(config.schedule.timezone)
+        # Have notifier connections open before the window so a success
+        # notification doesn't pay for TLS setup
+        self.scheduler.add_prewarm(self.notifications.prewarm)
         
         # Callbacks for external handling
         self.on_captcha: Optional[Callable[[str], Awaitable[None]]] = None
         self.on_success: Optional[Callable[[ReservationAttempt], Awaitable[None]]] = None
+        
+        # Last cart timer text seen by get_cart_expiry and its parsed value
+        self._last_timer_text: Optional[str] = None
+        self._last_timer_value: Optional[int] = None
     
     async def start(self):
         """Start the browser"""
@@ -67,10 +84,10 @@ class RecGovBrowserBot:
         
         self.playwright = await async_playwright().start()
         
-        # Launch browser
+        # Launch browser (slow_mo adds a delay after every action, so skip it when racing)
         self.browser = await self.playwright.chromium.launch(
             headless=self.config.browser.headless,
-            slow_mo=self.config.browser.slow_mo,
+            slow_mo=0 if self.race_mode else self.config.browser.slow_mo,
         )
         
         # Create context with custom user agent
@@ -99,6 +116,7 @@ class RecGovBrowserBot:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
+        await self.notifications.aclose()
         logger.info("Browser stopped")
     
     async def __aenter__(self):
@@ -254,8 +272,9 @@ class RecGovBrowserBot:
         
         return False
     
-    async def _check_captcha(self) -> bool:
+    async def _check_captcha(self, page: Optional[Page] = None) -> bool:
         """Check if a blocking CAPTCHA challenge is present (not invisible reCAPTCHA)"""
+        page = page or self.page
         # Check for visible reCAPTCHA challenge iframe (the actual challenge, not the badge)
         captcha_challenges = [
             # reCAPTCHA challenge iframe (visible challenge popup)
@@ -271,7 +290,7 @@ class RecGovBrowserBot:
         
         for selector in captcha_challenges:
             try:
-                element = await self.page.query_selector(selector)
+                element = await page.query_selector(selector)
                 if element:
                     # Verify it's actually visible
                     is_visible = await element.is_visible()
@@ -282,7 +301,7 @@ class RecGovBrowserBot:
         
         # Also check if we're on an explicit CAPTCHA/challenge page
         try:
-            url = self.page.url.lower()
+            url = page.url.lower()
             if 'captcha' in url or 'challenge' in url:
                 return True
         except:
@@ -290,17 +309,18 @@ class RecGovBrowserBot:
         
         return False
     
-    async def _handle_captcha(self):
+    async def _handle_captcha(self, page: Optional[Page] = None):
         """
         Handle CAPTCHA - pause for human intervention.
         """
+        page = page or self.page
         logger.warning("CAPTCHA detected - human intervention required")
         
         # Send notification
-        await self.notifications.notify_captcha(self.page.url)
+        await self.notifications.notify_captcha(page.url)
         
         if self.on_captcha:
-            await self.on_captcha(self.page.url)
+            await self.on_captcha(page.url)
         
         # Wait for CAPTCHA to be solved (poll for page change)
         print("\n" + "=" * 60)
@@ -317,12 +337,12 @@ class RecGovBrowserBot:
             await asyncio.sleep(2)
             
             # Check if CAPTCHA is gone
-            if not await self._check_captcha():
+            if not await self._check_captcha(page):
                 logger.info("CAPTCHA solved")
                 return
             
             # Check if we navigated away
-            if "captcha" not in self.page.url.lower() and await self._is_logged_in():
+            if "captcha" not in page.url.lower() and await self._is_logged_in():
                 logger.info("CAPTCHA bypassed")
                 return
         
@@ -421,20 +441,23 @@ class RecGovBrowserBot:
         available = []
         
         try:
-            # Look for "Available" buttons/links
-            buttons = await self.page.query_selector_all(
-                'button:has-text("Available"), a:has-text("Available")'
+            # Snapshot "Available" buttons/links in a single round-trip rather
+            # than reading attributes off each element handle
+            buttons = await self.page.eval_on_selector_all(
+                'button:has-text("Available"), a:has-text("Available")',
+                """
+                (elements) => elements.map(el => [
+                    el.getAttribute("data-campsite-id"),
+                    el.getAttribute("href"),
+                ])
+                """
             )
-            
-            for button in buttons:
-                # Try to extract campsite ID from parent or data attribute
-                site_id = await button.get_attribute("data-campsite-id")
-                if not site_id:
-                    # Try to get from href
-                    href = await button.get_attribute("href")
-                    if href and "/campsites/" in href:
-                        site_id = href.split("/campsites/")[-1].split("/")[0]
-                
+
+            for site_id, href in buttons:
+                # Fall back to extracting campsite ID from href
+                if not site_id and href and "/campsites/" in href:
+                    site_id = href.split("/campsites/")[-1].split("/")[0]
+
                 if site_id and site_id not in available:
                     available.append(site_id)
             
@@ -449,7 +472,8 @@ class RecGovBrowserBot:
         self,
         campsite_id: str,
         arrival: date,
-        departure: date
+        departure: date,
+        page: Optional[Page] = None
     ) -> bool:
         """
         Add a campsite to cart.
@@ -458,25 +482,27 @@ class RecGovBrowserBot:
         1. Availability grid page (with date cells to click)
         2. Campsite detail page (with date picker)
         
+        Works on the main page unless another tab is given.
         Returns True if successful.
         """
+        page = page or self.page
         logger.info(f"Adding campsite {campsite_id} to cart for {arrival} to {departure}...")
         
         try:
             # Take screenshot for debugging
-            await self.page.screenshot(path="add_to_cart_start.png")
+            await self._debug_screenshot(page, "add_to_cart_start", campsite_id)
             
             # Check if we're on an availability grid page (has the grid table)
-            availability_grid = await self.page.query_selector('table[class*="availability"], .rec-availability-grid')
+            availability_grid = await page.query_selector('table[class*="availability"], .rec-availability-grid')
             
             if availability_grid:
                 # === AVAILABILITY GRID INTERFACE ===
                 logger.info("Detected availability grid interface")
-                return await self._add_to_cart_from_grid(campsite_id, arrival, departure)
+                return await self._add_to_cart_from_grid(campsite_id, arrival, departure, page)
             else:
                 # === CAMPSITE DETAIL PAGE INTERFACE ===
                 logger.info("Using campsite detail page interface")
-                return await self._add_to_cart_from_detail_page(campsite_id, arrival, departure)
+                return await self._add_to_cart_from_detail_page(campsite_id, arrival, departure, page)
                 
         except PlaywrightTimeout:
             logger.error("Add to cart timed out")
@@ -489,7 +515,8 @@ class RecGovBrowserBot:
         self,
         campsite_id: str,
         arrival: date,
-        departure: date
+        departure: date,
+        page: Page
     ) -> bool:
         """Add to cart from availability grid interface"""
         
@@ -506,21 +533,21 @@ class RecGovBrowserBot:
             '[class*="DatePickerInput"]',
         ]
         
-        date_inputs = await self.page.query_selector_all('input[placeholder*="mm/dd/yyyy"]')
+        date_inputs = await page.query_selector_all('input[placeholder*="mm/dd/yyyy"]')
         if len(date_inputs) >= 2:
             # Fill arrival date
             logger.info("Found date range inputs, filling dates")
             await date_inputs[0].click(click_count=3)
-            await self.page.keyboard.type(arrival_str, delay=30)
+            await page.keyboard.type(arrival_str, delay=30)
             await asyncio.sleep(0.3)
             
             # Fill departure date  
             await date_inputs[1].click(click_count=3)
-            await self.page.keyboard.type(departure_str, delay=30)
+            await page.keyboard.type(departure_str, delay=30)
             await asyncio.sleep(0.3)
             
             # Press Enter to apply dates
-            await self.page.keyboard.press("Enter")
+            await page.keyboard.press("Enter")
             await asyncio.sleep(2)
         elif len(date_inputs) == 1:
             # Single date range input - click to open calendar
@@ -528,9 +555,9 @@ class RecGovBrowserBot:
             await asyncio.sleep(1)
         
         # Step 2: Find the row for our campsite
-        site_row = await self.page.query_selector(f'tr:has(a:has-text("{campsite_id}"))')
+        site_row = await page.query_selector(f'tr:has(a:has-text("{campsite_id}"))')
         if not site_row:
-            site_row = await self.page.query_selector(f'tr:has(td:has-text("{campsite_id}"))')
+            site_row = await page.query_selector(f'tr:has(td:has-text("{campsite_id}"))')
         
         if not site_row:
             logger.warning(f"Could not find row for site {campsite_id}")
@@ -571,13 +598,14 @@ class RecGovBrowserBot:
         await asyncio.sleep(1)
         
         # Step 4: Click Add to Cart button
-        return await self._click_add_to_cart()
+        return await self._click_add_to_cart(page, campsite_id)
     
     async def _add_to_cart_from_detail_page(
         self,
         campsite_id: str,
         arrival: date,
-        departure: date
+        departure: date,
+        page: Page
     ) -> bool:
         """Add to cart from campsite detail page interface"""
         
@@ -585,19 +613,25 @@ class RecGovBrowserBot:
         departure_str = departure.strftime("%m/%d/%Y")
         
         # Try date inputs
-        date_inputs = await self.page.query_selector_all('input[placeholder*="mm/dd/yyyy"]')
+        date_inputs = await page.query_selector_all('input[placeholder*="mm/dd/yyyy"]')
         if len(date_inputs) >= 2:
             logger.info("Found date inputs on detail page")
             await date_inputs[0].click(click_count=3)
-            await self.page.keyboard.type(arrival_str, delay=30)
+            await page.keyboard.type(arrival_str, delay=30)
             await date_inputs[1].click(click_count=3)
-            await self.page.keyboard.type(departure_str, delay=30)
-            await self.page.keyboard.press("Enter")
+            await page.keyboard.type(departure_str, delay=30)
+            await page.keyboard.press("Enter")
             await asyncio.sleep(2)
         
-        return await self._click_add_to_cart()
+        return await self._click_add_to_cart(page, campsite_id)
     
-    async def _click_add_to_cart(self) -> bool:
+    async def _debug_screenshot(self, page: Page, name: str, campsite_id: str):
+        """Save a debug screenshot; tabs other than the main page get per-site names"""
+        if page is not self.page:
+            name = f"{name}_{campsite_id}"
+        await page.screenshot(path=f"{name}.png")
+    
+    async def _click_add_to_cart(self, page: Page, campsite_id: str) -> bool:
         """Click Add to Cart button and verify success"""
         
         # Look for "Add to Cart" or "Book" button
@@ -613,7 +647,7 @@ class RecGovBrowserBot:
         add_button = None
         for selector in add_button_selectors:
             try:
-                add_button = await self.page.query_selector(selector)
+                add_button = await page.query_selector(selector)
                 if add_button and await add_button.is_visible():
                     logger.info(f"Found add button with selector: {selector}")
                     break
@@ -623,7 +657,7 @@ class RecGovBrowserBot:
         
         if not add_button:
             logger.warning("Add to Cart button not found")
-            await self.page.screenshot(path="no_button.png")
+            await self._debug_screenshot(page, "no_button", campsite_id)
             return False
         
         # Wait for button to become enabled
@@ -643,8 +677,8 @@ class RecGovBrowserBot:
         await asyncio.sleep(3)
         
         # Check for CAPTCHA
-        if await self._check_captcha():
-            await self._handle_captcha()
+        if await self._check_captcha(page):
+            await self._handle_captcha(page)
         
         # Check for success indicators
         success_indicators = [
@@ -655,7 +689,7 @@ class RecGovBrowserBot:
         
         for selector in success_indicators:
             try:
-                element = await self.page.wait_for_selector(selector, timeout=3000)
+                element = await page.wait_for_selector(selector, timeout=3000)
                 if element:
                     logger.info(f"Success indicator found: {selector}")
                     return True
@@ -671,7 +705,7 @@ class RecGovBrowserBot:
         ]
         for selector in error_selectors:
             try:
-                error = await self.page.query_selector(selector)
+                error = await page.query_selector(selector)
                 if error and await error.is_visible():
                     error_text = await error.text_content()
                     logger.warning(f"Add to cart failed: {error_text}")
@@ -681,8 +715,8 @@ class RecGovBrowserBot:
         
         # VERIFY by navigating to cart
         logger.info("Verifying cart contents...")
-        await self.page.goto(WebPages.cart())
-        await self.page.wait_for_load_state("domcontentloaded")
+        await page.goto(WebPages.cart())
+        await page.wait_for_load_state("domcontentloaded")
         await asyncio.sleep(2)
         
         # Check if cart has items
@@ -695,7 +729,7 @@ class RecGovBrowserBot:
         
         for selector in cart_item_selectors:
             try:
-                item = await self.page.query_selector(selector)
+                item = await page.query_selector(selector)
                 if item and await item.is_visible():
                     logger.info(f"Cart item verified: {selector}")
                     return True
@@ -703,15 +737,66 @@ class RecGovBrowserBot:
                 continue
         
         # Check for empty cart
-        empty = await self.page.query_selector('text="Your cart is empty"')
+        empty = await page.query_selector('text="Your cart is empty"')
         if empty and await empty.is_visible():
             logger.warning("Cart is empty - add to cart failed")
-            await self.page.screenshot(path="cart_empty.png")
+            await self._debug_screenshot(page, "cart_empty", campsite_id)
             return False
         
         logger.warning("Could not verify cart - assuming failure")
         return False
     
+    async def _add_to_cart_in_new_tab(
+        self,
+        campsite_id: str,
+        arrival: date,
+        departure: date
+    ) -> bool:
+        """Open the campsite page in its own tab and try to add it to cart"""
+        page = await self.context.new_page()
+        try:
+            await page.goto(WebPages.campsite(campsite_id))
+            await page.wait_for_load_state("domcontentloaded")
+            return await self.add_to_cart(campsite_id, arrival, departure, page=page)
+        finally:
+            await page.close()
+    
+    async def _race_sites(
+        self,
+        site_ids: List[str],
+        arrival: date,
+        departure: date
+    ) -> Optional[str]:
+        """
+        Try several sites at once, one tab per site.
+        
+        Returns the first site that made it into the cart (or None).
+        The remaining attempts are cancelled as soon as one succeeds.
+        
+        Cancelling a tab does not undo a click it already made: a losing
+        tab that got past "Add to Cart" leaves its site in the cart, and
+        nothing here removes it. Check the cart before checking out.
+        """
+        tasks = {
+            asyncio.create_task(self._add_to_cart_in_new_tab(site_id, arrival, departure)): site_id
+            for site_id in site_ids
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception():
+                        logger.error(f"Error trying site {tasks[task]}: {task.exception()}")
+                    elif task.result():
+                        return tasks[task]
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
     async def navigate_to_cart(self):
         """Navigate to the shopping cart"""
         await self.page.goto(WebPages.cart())
@@ -729,15 +814,22 @@ class RecGovBrowserBot:
             timer = await self.page.query_selector('.cart-timer, [data-component="CartTimer"]')
             if timer:
                 text = await timer.text_content()
+                # The timer is polled, so skip parsing when the text hasn't changed
+                if text == self._last_timer_text:
+                    return self._last_timer_value
+                value = None
                 # Parse timer text (e.g., "14:32" or "14 minutes")
                 if ":" in text:
                     parts = text.split(":")
-                    return int(parts[0]) * 60 + int(parts[1])
-                # Try to extract minutes
-                import re
-                match = re.search(r'(\d+)\s*min', text)
-                if match:
-                    return int(match.group(1)) * 60
+                    value = int(parts[0]) * 60 + int(parts[1])
+                else:
+                    # Try to extract minutes
+                    match = _TIMER_MINUTES_RE.search(text)
+                    if match:
+                        value = int(match.group(1)) * 60
+                self._last_timer_text = text
+                self._last_timer_value = value
+                return value
         except:
             pass
         return None
@@ -762,7 +854,8 @@ class RecGovBrowserBot:
         if retry_strategy is None:
             retry_strategy = RetryStrategy(
                 max_attempts=self.config.retry.max_attempts,
-                base_delay_ms=self.config.retry.attempt_delay_ms
+                base_delay_ms=self.config.retry.attempt_delay_ms,
+                jitter=self.config.retry.jitter
             )
         
         attempt = ReservationAttempt(
@@ -779,7 +872,8 @@ class RecGovBrowserBot:
                     return attempt
             
             # Build list of sites to try
-            sites_to_try = list(target.campsite_ids) if target.campsite_ids else []
+            sites_to_try = list(target.campsite_ids or ())
+            seen = set(sites_to_try)
             
             # If no specific sites or using fallbacks, find available ones
             if not sites_to_try or self.config.retry.use_fallback_sites:
@@ -789,7 +883,8 @@ class RecGovBrowserBot:
                     target.departure_date
                 )
                 for site_id in available:
-                    if site_id not in sites_to_try:
+                    if site_id not in seen:
+                        seen.add(site_id)
                         sites_to_try.append(site_id)
             
             if not sites_to_try:
@@ -803,13 +898,25 @@ class RecGovBrowserBot:
                 retry_strategy.record_attempt()
                 attempt.attempts_made = retry_strategy.attempts
                 
-                for site_id in sites_to_try:
+                # Sites are tried `parallel_tabs` at a time (1 = one after another)
+                width = max(1, self.config.browser.parallel_tabs)
+                for i in range(0, len(sites_to_try), width):
+                    batch = sites_to_try[i:i + width]
                     try:
-                        success = await self.add_to_cart(
-                            site_id,
-                            target.arrival_date,
-                            target.departure_date
-                        )
+                        if len(batch) > 1:
+                            site_id = await self._race_sites(
+                                batch,
+                                target.arrival_date,
+                                target.departure_date
+                            )
+                            success = site_id is not None
+                        else:
+                            site_id = batch[0]
+                            success = await self.add_to_cart(
+                                site_id,
+                                target.arrival_date,
+                                target.departure_date
+                            )
                         
                         if success:
                             # Save session
@@ -828,7 +935,7 @@ class RecGovBrowserBot:
                                 subtotal=0,
                                 fees=0,
                                 total=0,
-                                expires_at=datetime.now() + __import__('datetime').timedelta(minutes=15)
+                                expires_at=datetime.now() + _CART_TTL
                             )
                             
                             attempt.mark_success(cart_item.campsite, cart_item)
@@ -839,11 +946,11 @@ class RecGovBrowserBot:
                             return attempt
                             
                     except Exception as e:
-                        logger.error(f"Error trying site {site_id}: {e}")
+                        logger.error(f"Error trying sites {batch}: {e}")
                 
                 # Wait before retry
                 if retry_strategy.should_retry():
-                    await asyncio.sleep(retry_strategy.base_delay_ms / 1000)
+                    await retry_strategy.wait()
             
             attempt.mark_failed(f"Failed after {attempt.attempts_made} attempts")
             
@@ -1020,7 +1127,7 @@ async def main():
         """Attempt reservation immediately"""
         async def run():
             cfg = Config.from_yaml(config)
-            async with RecGovBrowserBot(cfg) as bot:
+            async with RecGovBrowserBot(cfg, race_mode=True) as bot:
                 target = ReservationTarget(
                     campground_id=cfg.target.campground_id,
                     campsite_ids=cfg.target.campsite_ids,
@@ -1048,7 +1155,7 @@ async def main():
             console.print(f"Scheduled for: {cfg.schedule.window_datetime}")
             console.print("Press Ctrl+C to cancel\n")
             
-            async with RecGovBrowserBot(cfg) as bot:
+            async with RecGovBrowserBot(cfg, race_mode=True) as bot:
                 target = ReservationTarget(
                     campground_id=cfg.target.campground_id,
                     campsite_ids=cfg.target.campsite_ids,
@@ -3,23 +3,109 @@ Browser session management for Recreation.gov bot
 
 Handles session persistence, cookie management, and handoff to user.
 """
-import json
 import logging
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from playwright.async_api import Page, BrowserContext, Cookie
 
+from ..common.jsonutil import dumps_bytes, loads
 from ..common.models import SessionState
 
+try:
+    import msgpack
+except ImportError:  # optional, only needed for .msgpack session files
+    msgpack = None
+
 logger = logging.getLogger(__name__)
 
+# Netscape cookie file: domain, include subdomains, path, secure, expires, name, value
+_NETSCAPE_HEADER = "# Netscape HTTP Cookie File"
+_NETSCAPE_LINE = "{}\tTRUE\t{}\t{}\t{}\t{}\t{}"
+_NETSCAPE_BOOL = {True: "TRUE", False: "FALSE"}
+
+# Handoff instruction boxes, filled in with str.format by generate_handoff_instructions
+_URL_INSTRUCTIONS = """
+╔══════════════════════════════════════════════════════════════╗
+║                    🏕️ RESERVATION SECURED!                    ║
+╠══════════════════════════════════════════════════════════════╣
+║                                                              ║
+║  Your campsite is in the cart!                              ║
+║                                                              ║
+║  1. Open this URL in your browser:                          ║
+║     {}
+║                                                              ║
+║  2. Log in with your Recreation.gov account                 ║
+║                                                              ║
+║  3. Complete checkout within 15 MINUTES                     ║
+║                                                              ║
+║  ⚠️  The reservation will be released if not completed!      ║
+║                                                              ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+_COOKIES_INSTRUCTIONS = """
+╔══════════════════════════════════════════════════════════════╗
+║                    🏕️ RESERVATION SECURED!                    ║
+╠══════════════════════════════════════════════════════════════╣
+║                                                              ║
+║  Your campsite is in the cart!                              ║
+║                                                              ║
+║  To access your cart, import these cookies:                 ║
+║                                                              ║
+║  1. Install 'EditThisCookie' browser extension              ║
+║  2. Go to recreation.gov                                    ║
+║  3. Click extension → Import → Paste the JSON               ║
+║  4. Refresh and go to Cart                                  ║
+║                                                              ║
+║  Cookie data saved to: {}
+║                                                              ║
+║  ⚠️  Complete checkout within 15 MINUTES!                    ║
+║                                                              ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+_REMOTE_INSTRUCTIONS = """
+╔══════════════════════════════════════════════════════════════╗
+║                    🏕️ RESERVATION SECURED!                    ║
+╠══════════════════════════════════════════════════════════════╣
+║                                                              ║
+║  Your campsite is in the cart!                              ║
+║                                                              ║
+║  The browser is still running. Access it at:                ║
+║  {}
+║                                                              ║
+║  Complete checkout in the open browser window.              ║
+║                                                              ║
+║  ⚠️  Complete checkout within 15 MINUTES!                    ║
+║                                                              ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+# method -> (template, data key, default value)
+_HANDOFF_INSTRUCTIONS = {
+    "url": (_URL_INSTRUCTIONS, "url", "https://www.recreation.gov/cart"),
+    "cookies": (_COOKIES_INSTRUCTIONS, "file", "cookies.json"),
+    "remote": (_REMOTE_INSTRUCTIONS, "url", "Browser window should be visible"),
+}
+
 
 class BrowserSession:
     """
     Manages browser session state for persistence and handoff.
     """
     
+    __slots__ = (
+        "session_file",
+        "cookies",
+        "local_storage",
+        "session_storage",
+        "logged_in",
+        "last_refresh",
+        "_file_mtime",
+    )
+    
     def __init__(self, session_file: Optional[str] = None):
         self.session_file = Path(session_file) if session_file else None
         self.cookies: List[Cookie] = []
@@ -27,6 +113,9 @@ class BrowserSession:
         self.session_storage: Dict[str, str] = {}
         self.logged_in = False
         self.last_refresh: Optional[datetime] = None
+        
+        # mtime of the session file when it was last loaded or saved
+        self._file_mtime: Optional[int] = None
     
     async def capture_from_page(self, page: Page, context: BrowserContext):
         """
@@ -37,29 +126,22 @@ class BrowserSession:
         # Capture cookies from context
         self.cookies = await context.cookies()
         
-        # Capture local storage
-        self.local_storage = await page.evaluate("""
-            () => {
-                const items = {};
-                for (let i = 0; i < localStorage.length; i++) {
-                    const key = localStorage.key(i);
-                    items[key] = localStorage.getItem(key);
-                }
-                return items;
-            }
-        """)
-        
-        # Capture session storage
-        self.session_storage = await page.evaluate("""
+        # Capture local and session storage in one round trip
+        storage = await page.evaluate("""
             () => {
-                const items = {};
-                for (let i = 0; i < sessionStorage.length; i++) {
-                    const key = sessionStorage.key(i);
-                    items[key] = sessionStorage.getItem(key);
-                }
-                return items;
+                const dump = (store) => {
+                    const items = {};
+                    for (let i = 0; i < store.length; i++) {
+                        const key = store.key(i);
+                        items[key] = store.getItem(key);
+                    }
+                    return items;
+                };
+                return {local: dump(localStorage), session: dump(sessionStorage)};
             }
         """)
+        self.local_storage = storage.get("local", {})
+        self.session_storage = storage.get("session", {})
         
         self.logged_in = True
         self.last_refresh = datetime.now()
@@ -79,36 +161,55 @@ class BrowserSession:
             logger.warning("No session to restore")
             return False
         
+        # Drop expired cookies and duplicates (last one wins) so Playwright
+        # doesn't set cookies that are useless or overwritten anyway
+        now = time.time()
+        fresh = {}
+        for cookie in self.cookies:
+            expires = cookie.get("expires", -1)
+            if expires and 0 < expires < now:
+                continue
+            fresh[(cookie.get("name"), cookie.get("domain"), cookie.get("path"))] = cookie
+        self.cookies = list(fresh.values())
+        
+        if not self.cookies:
+            logger.warning("No unexpired cookies to restore")
+            return False
+        
         # Restore cookies (can be done before navigation)
         await context.add_cookies(self.cookies)
         
+        # Nothing else to restore: skip the page navigation entirely
+        if not page or not (self.local_storage or self.session_storage):
+            logger.info("Session restored to browser")
+            return True
+        
         # Restore storage - need to be on the actual domain first
-        if page and (self.local_storage or self.session_storage):
-            try:
-                # Navigate to the site first to enable localStorage access
-                current_url = page.url
-                if not current_url or 'recreation.gov' not in current_url:
-                    await page.goto("https://www.recreation.gov", wait_until="domcontentloaded")
-                
-                if self.local_storage:
-                    await page.evaluate("""
-                        (items) => {
-                            for (const [key, value] of Object.entries(items)) {
-                                localStorage.setItem(key, value);
-                            }
+        try:
+            # Navigate to the site first to enable localStorage access
+            current_url = page.url
+            if not current_url or 'recreation.gov' not in current_url:
+                await page.goto("https://www.recreation.gov", wait_until="domcontentloaded")
+            
+            if self.local_storage:
+                await page.evaluate("""
+                    (items) => {
+                        for (const [key, value] of Object.entries(items)) {
+                            localStorage.setItem(key, value);
                         }
-                    """, self.local_storage)
-                
-                if self.session_storage:
-                    await page.evaluate("""
-                        (items) => {
-                            for (const [key, value] of Object.entries(items)) {
-                                sessionStorage.setItem(key, value);
-                            }
+                    }
+                """, self.local_storage)
+            
+            if self.session_storage:
+                await page.evaluate("""
+                    (items) => {
+                        for (const [key, value] of Object.entries(items)) {
+                            sessionStorage.setItem(key, value);
                         }
-                    """, self.session_storage)
-            except Exception as e:
-                logger.warning(f"Could not restore storage: {e}")
+                    }
+                """, self.session_storage)
+        except Exception as e:
+            logger.warning(f"Could not restore storage: {e}")
         
         logger.info("Session restored to browser")
         return True
@@ -129,8 +230,8 @@ class BrowserSession:
                 "last_refresh": self.last_refresh.isoformat() if self.last_refresh else None
             }
             
-            with open(self.session_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            self.session_file.write_bytes(self._encode(data))
+            self._file_mtime = self.session_file.stat().st_mtime_ns
             
             logger.debug(f"Session saved to {self.session_file}")
             
@@ -143,8 +244,12 @@ class BrowserSession:
             return False
         
         try:
-            with open(self.session_file) as f:
-                data = json.load(f)
+            # Nothing to re-read if the file hasn't changed since we last touched it
+            mtime = self.session_file.stat().st_mtime_ns
+            if mtime == self._file_mtime and self.cookies:
+                return True
+            
+            data = self._decode(self.session_file.read_bytes())
             
             self.cookies = data.get("cookies", [])
             self.local_storage = data.get("local_storage", {})
@@ -154,6 +259,7 @@ class BrowserSession:
             if data.get("last_refresh"):
                 self.last_refresh = datetime.fromisoformat(data["last_refresh"])
             
+            self._file_mtime = mtime
             logger.info(f"Session loaded from {self.session_file}")
             return True
             
@@ -161,6 +267,37 @@ class BrowserSession:
             logger.error(f"Failed to load session: {e}")
             return False
     
+    def invalidate_cache(self):
+        """Force the next load() to re-read the session file"""
+        self._file_mtime = None
+    
+    def _file_format(self) -> str:
+        """
+        Pick the session file format from its suffix.
+        
+        .msgpack files use msgpack; anything else is JSON. A .msgpack path
+        without msgpack installed is an error rather than silently holding
+        JSON that a later install could no longer read.
+        """
+        if self.session_file.suffix.lower() == ".msgpack":
+            if msgpack is None:
+                raise RuntimeError(
+                    f"{self.session_file} needs msgpack; install it or use a .json session file"
+                )
+            return "msgpack"
+        return "json"
+    
+    def _encode(self, data: Dict[str, Any]) -> bytes:
+        if self._file_format() == "msgpack":
+            return msgpack.packb(data, use_bin_type=True, default=str)
+        # Encode once and write once rather than streaming many small chunks
+        return dumps_bytes(data, default=str)
+    
+    def _decode(self, raw: bytes) -> Dict[str, Any]:
+        if self._file_format() == "msgpack":
+            return msgpack.unpackb(raw, raw=False)
+        return loads(raw)
+    
     def is_expired(self, max_age_hours: int = 24) -> bool:
         """Check if session is too old"""
         if not self.last_refresh:
@@ -184,25 +321,18 @@ class BrowserSession:
         """
         Export cookies in Netscape format (compatible with curl, wget).
         """
-        lines = ["# Netscape HTTP Cookie File"]
-        
-        for cookie in self.cookies:
-            domain = cookie.get("domain", "")
-            if not domain.startswith("."):
-                domain = "." + domain
-            
-            line = "\t".join([
-                domain,
-                "TRUE",  # include subdomains
+        return "\n".join([_NETSCAPE_HEADER] + [
+            _NETSCAPE_LINE.format(
+                domain if domain[:1] == "." else "." + domain,
                 cookie.get("path", "/"),
-                "TRUE" if cookie.get("secure") else "FALSE",
-                str(int(cookie.get("expires", 0))),
+                _NETSCAPE_BOOL[bool(cookie.get("secure"))],
+                int(cookie.get("expires", 0)),
                 cookie.get("name", ""),
-                cookie.get("value", "")
-            ])
-            lines.append(line)
-        
-        return "\n".join(lines)
+                cookie.get("value", ""),
+            )
+            for cookie in self.cookies
+            for domain in (cookie.get("domain", ""),)
+        ])
     
     def export_for_requests(self) -> Dict[str, str]:
         """
@@ -263,64 +393,8 @@ class SessionHandoff:
     @staticmethod
     def generate_handoff_instructions(method: str, data: Dict[str, Any]) -> str:
         """Generate human-readable handoff instructions"""
-        if method == "url":
-            url = data.get('url', 'https://www.recreation.gov/cart')
-            return f"""
-╔══════════════════════════════════════════════════════════════╗
-║                    🏕️ RESERVATION SECURED!                    ║
-╠══════════════════════════════════════════════════════════════╣
-║                                                              ║
-║  Your campsite is in the cart!                              ║
-║                                                              ║
-║  1. Open this URL in your browser:                          ║
-║     {url}
-║                                                              ║
-║  2. Log in with your Recreation.gov account                 ║
-║                                                              ║
-║  3. Complete checkout within 15 MINUTES                     ║
-║                                                              ║
-║  ⚠️  The reservation will be released if not completed!      ║
-║                                                              ║
-╚══════════════════════════════════════════════════════════════╝
-"""
-        elif method == "cookies":
-            file_path = data.get('file', 'cookies.json')
-            return f"""
-╔══════════════════════════════════════════════════════════════╗
-║                    🏕️ RESERVATION SECURED!                    ║
-╠══════════════════════════════════════════════════════════════╣
-║                                                              ║
-║  Your campsite is in the cart!                              ║
-║                                                              ║
-║  To access your cart, import these cookies:                 ║
-║                                                              ║
-║  1. Install 'EditThisCookie' browser extension              ║
-║  2. Go to recreation.gov                                    ║
-║  3. Click extension → Import → Paste the JSON               ║
-║  4. Refresh and go to Cart                                  ║
-║                                                              ║
-║  Cookie data saved to: {file_path}
-║                                                              ║
-║  ⚠️  Complete checkout within 15 MINUTES!                    ║
-║                                                              ║
-╚══════════════════════════════════════════════════════════════╝
-"""
-        elif method == "remote":
-            remote_url = data.get('url', 'Browser window should be visible')
-            return f"""
-╔══════════════════════════════════════════════════════════════╗
-║                    🏕️ RESERVATION SECURED!                    ║
-╠══════════════════════════════════════════════════════════════╣
-║                                                              ║
-║  Your campsite is in the cart!                              ║
-║                                                              ║
-║  The browser is still running. Access it at:                ║
-║  {remote_url}
-║                                                              ║
-║  Complete checkout in the open browser window.              ║
-║                                                              ║
-║  ⚠️  Complete checkout within 15 MINUTES!                    ║
-║                                                              ║
-╚══════════════════════════════════════════════════════════════╝
-"""
+        entry = _HANDOFF_INSTRUCTIONS.get(method)
+        if entry:
+            template, key, default = entry
+            return template.format(data.get(key, default))
         return "Reservation secured! Check the browser window."
@@ -4,35 +4,45 @@ Browser URL helpers for Recreation.gov.
 
 BASE_URL = "https://www.recreation.gov"
 
+# Fixed pages
+HOME_URL = BASE_URL
+LOGIN_URL = f"{BASE_URL}/log-in"
+CART_URL = f"{BASE_URL}/cart"
+CHECKOUT_URL = f"{BASE_URL}/checkout"
+
+# Per-id pages, as bound str.format templates
+CAMPGROUND_URL = (BASE_URL + "/camping/campgrounds/{}").format
+CAMPSITE_URL = (BASE_URL + "/camping/campsites/{}").format
+AVAILABILITY_URL = (BASE_URL + "/camping/campgrounds/{}/availability").format
+
 
 class WebPages:
     """URLs for browser-based automation"""
 
     @staticmethod
     def home() -> str:
-        return BASE_URL
+        return HOME_URL
 
     @staticmethod
     def login() -> str:
-        return f"{BASE_URL}/log-in"
+        return LOGIN_URL
 
     @staticmethod
     def campground(campground_id: str) -> str:
-        return f"{BASE_URL}/camping/campgrounds/{campground_id}"
+        return CAMPGROUND_URL(campground_id)
 
     @staticmethod
     def campsite(campsite_id: str) -> str:
-        return f"{BASE_URL}/camping/campsites/{campsite_id}"
+        return CAMPSITE_URL(campsite_id)
 
     @staticmethod
     def availability(campground_id: str) -> str:
-        return f"{BASE_URL}/camping/campgrounds/{campground_id}/availability"
+        return AVAILABILITY_URL(campground_id)
 
     @staticmethod
     def cart() -> str:
-        return f"{BASE_URL}/cart"
+        return CART_URL
 
     @staticmethod
     def checkout() -> str:
-        return f"{BASE_URL}/checkout"
-
+        return CHECKOUT_URL
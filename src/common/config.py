@@ -3,13 +3,49 @@ Configuration management for Recreation.gov bot
 """
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 from dateutil import parser as date_parser
 import pytz
 
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper  # libyaml-backed, much faster
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+
+# Environment variables Config.from_env can't do without
+_REQUIRED_ENV = (
+    "RECGOV_EMAIL",
+    "RECGOV_PASSWORD",
+    "RECGOV_CAMPGROUND_ID",
+    "RECGOV_ARRIVAL_DATE",
+    "RECGOV_DEPARTURE_DATE",
+)
+
+
+@lru_cache(maxsize=8)
+def _read_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parsed contents of one version of a YAML file.
+    
+    The file's mtime and size are part of the cache key, so an edited file
+    is parsed again. Callers must not mutate the returned data.
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse a config date/time string, trying the fast ISO 8601 path first"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return date_parser.parse(value)
+
 
 class CredentialsConfig(BaseModel):
     email: str
@@ -24,13 +60,28 @@ class TargetConfig(BaseModel):
     num_people: int = 2
     equipment: Optional[str] = None
     
+    # Parsed dates, keyed by the string they were parsed from
+    _arrival_cache: Optional[Tuple[str, datetime]] = PrivateAttr(default=None)
+    _departure_cache: Optional[Tuple[str, datetime]] = PrivateAttr(default=None)
+    
+    @model_validator(mode="after")
+    def _parse_dates(self) -> "TargetConfig":
+        # Parse up front so bad dates fail at load time, not mid-run
+        self._arrival_cache = (self.arrival_date, _parse_datetime(self.arrival_date))
+        self._departure_cache = (self.departure_date, _parse_datetime(self.departure_date))
+        return self
+    
     @property
     def arrival(self) -> datetime:
-        return date_parser.parse(self.arrival_date)
+        if self._arrival_cache is None or self._arrival_cache[0] != self.arrival_date:
+            self._arrival_cache = (self.arrival_date, _parse_datetime(self.arrival_date))
+        return self._arrival_cache[1]
     
     @property
     def departure(self) -> datetime:
-        return date_parser.parse(self.departure_date)
+        if self._departure_cache is None or self._departure_cache[0] != self.departure_date:
+            self._departure_cache = (self.departure_date, _parse_datetime(self.departure_date))
+        return self._departure_cache[1]
 
 
 class ScheduleConfig(BaseModel):
@@ -39,18 +90,31 @@ class ScheduleConfig(BaseModel):
     prep_time: int = 300
     early_start_ms: int = -100
     
+    # (window_opens, timezone, prep_time) -> (window time, prep time)
+    _resolved: Optional[Tuple[Tuple[str, str, int], datetime, datetime]] = PrivateAttr(default=None)
+    
+    @model_validator(mode="after")
+    def _resolve_times(self) -> "ScheduleConfig":
+        # Resolve at load time so the first read near the window is a lookup
+        self._resolve()
+        return self
+    
+    def _resolve(self) -> Tuple[Tuple[str, str, int], datetime, datetime]:
+        key = (self.window_opens, self.timezone, self.prep_time)
+        if self._resolved is None or self._resolved[0] != key:
+            dt = _parse_datetime(self.window_opens)
+            if dt.tzinfo is None:
+                dt = pytz.timezone(self.timezone).localize(dt)
+            self._resolved = (key, dt, dt - timedelta(seconds=self.prep_time))
+        return self._resolved
+    
     @property
     def window_datetime(self) -> datetime:
-        tz = pytz.timezone(self.timezone)
-        dt = date_parser.parse(self.window_opens)
-        if dt.tzinfo is None:
-            dt = tz.localize(dt)
-        return dt
+        return self._resolve()[1]
     
     @property
     def prep_datetime(self) -> datetime:
-        from datetime import timedelta
-        return self.window_datetime - timedelta(seconds=self.prep_time)
+        return self._resolve()[2]
 
 
 class EmailConfig(BaseModel):
@@ -81,6 +145,7 @@ class NotificationsConfig(BaseModel):
 class BrowserConfig(BaseModel):
     headless: bool = False
     slow_mo: int = 50
+    parallel_tabs: int = 1
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     save_session: bool = True
     session_file: str = "session.json"
@@ -94,6 +159,7 @@ class APIConfig(BaseModel):
     max_retries: int = 3
     retry_delay: float = 0.5
     requests_per_second: int = 2
+    race_width: int = 1
     headers: Dict[str, str] = Field(default_factory=lambda: {
         "Accept": "application/json, text/plain, */*",
         "Accept-Language": "en-US,en;q=0.9",
@@ -105,6 +171,7 @@ class APIConfig(BaseModel):
 class RetryConfig(BaseModel):
     max_attempts: int = 10
     attempt_delay_ms: int = 100
+    jitter: bool = False
     use_fallback_sites: bool = True
     stop_on_success: bool = True
 
@@ -141,27 +208,35 @@ class Config(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
         
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        # Reloading an unchanged file skips the YAML parse; the models are
+        # still built fresh, so callers get their own Config to modify
+        stat = path.stat()
+        data = _read_yaml(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
         
         return cls(**data)
     
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables"""
+        env = os.environ
+        missing = [key for key in _REQUIRED_ENV if key not in env]
+        if missing:
+            raise KeyError(missing[0])
+        
+        campsite_ids = env.get("RECGOV_CAMPSITE_IDS", "")
         return cls(
             credentials=CredentialsConfig(
-                email=os.environ["RECGOV_EMAIL"],
-                password=os.environ["RECGOV_PASSWORD"]
+                email=env["RECGOV_EMAIL"],
+                password=env["RECGOV_PASSWORD"]
             ),
             target=TargetConfig(
-                campground_id=os.environ["RECGOV_CAMPGROUND_ID"],
-                campsite_ids=os.environ.get("RECGOV_CAMPSITE_IDS", "").split(","),
-                arrival_date=os.environ["RECGOV_ARRIVAL_DATE"],
-                departure_date=os.environ["RECGOV_DEPARTURE_DATE"],
+                campground_id=env["RECGOV_CAMPGROUND_ID"],
+                campsite_ids=campsite_ids.split(",") if campsite_ids else [],
+                arrival_date=env["RECGOV_ARRIVAL_DATE"],
+                departure_date=env["RECGOV_DEPARTURE_DATE"],
             ),
             schedule=ScheduleConfig(
-                window_opens=os.environ.get("RECGOV_WINDOW_OPENS", "2025-01-01 07:00:00"),
+                window_opens=env.get("RECGOV_WINDOW_OPENS", "2025-01-01 07:00:00"),
             )
         )
     
@@ -169,7 +244,7 @@ class Config(BaseModel):
         """Save configuration to YAML file"""
         path = Path(path)
         with open(path, 'w') as f:
-            yaml.dump(self.model_dump(), f, default_flow_style=False)
+            yaml.dump(self.model_dump(), f, Dumper=_YamlDumper, default_flow_style=False)
 
 
 def load_config(path: Optional[str] = None) -> Config:
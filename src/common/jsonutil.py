@@ -0,0 +1,45 @@
+"""
+JSON helpers and optional-dependency probes shared across the bot
+"""
+import importlib.util
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def _installed(*modules: str) -> bool:
+    return any(importlib.util.find_spec(name) is not None for name in modules)
+
+
+# Only advertise encodings httpx can actually decode: it decodes br with
+# brotli/brotlicffi and zstd with zstandard, and passes anything else through
+# still compressed
+ACCEPT_ENCODING = ", ".join(
+    ["gzip", "deflate"]
+    + (["br"] if _installed("brotli", "brotlicffi") else [])
+    + (["zstd"] if _installed("zstandard") else [])
+)
+
+
+def dumps_bytes(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=default, separators=(',', ':')).encode()
+
+
+def loads(raw: bytes | str) -> Any:
+    """Parse JSON from bytes or str, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -1,12 +1,17 @@
 """
 Data models for Recreation.gov bot
 """
-from datetime import datetime, date
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field, fields
+from datetime import datetime, date, timedelta
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, List, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from enum import Enum
 
 
+_ONE_DAY = timedelta(days=1)
+
+
 class ReservationStatus(str, Enum):
     PENDING = "pending"
     SCHEDULED = "scheduled"
@@ -28,6 +33,8 @@ class CampsiteAvailability(str, Enum):
 
 class Campground(BaseModel):
     """Recreation.gov campground"""
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     name: str
     facility_id: Optional[str] = None
@@ -43,6 +50,8 @@ class Campground(BaseModel):
 
 class Campsite(BaseModel):
     """Individual campsite within a campground"""
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     campground_id: str
     name: str  # e.g., "A001" or "Site 42"
@@ -58,6 +67,8 @@ class Campsite(BaseModel):
 
 class AvailabilitySlot(BaseModel):
     """Availability for a specific date"""
+    model_config = ConfigDict(frozen=True)
+    
     date: date
     status: CampsiteAvailability
     
@@ -76,20 +87,21 @@ class CampsiteAvailabilityResult(BaseModel):
     
     def is_available_for_dates(self, start: date, end: date) -> bool:
         """Check if campsite is available for entire date range"""
+        # Index slots once per call; availabilities may be extended after creation
+        by_date = {a.date: a for a in self.availabilities}
         current = start
         while current < end:
-            slot = next(
-                (a for a in self.availabilities if a.date == current), 
-                None
-            )
+            slot = by_date.get(current)
             if not slot or not slot.is_available:
                 return False
-            current = date.fromordinal(current.toordinal() + 1)
+            current += _ONE_DAY
         return True
 
 
 class ReservationTarget(BaseModel):
     """Target reservation configuration"""
+    model_config = ConfigDict(frozen=True)
+    
     campground_id: str
     campsite_ids: List[str] = Field(default_factory=list)
     arrival_date: date
@@ -97,22 +109,36 @@ class ReservationTarget(BaseModel):
     num_people: int = 2
     equipment: Optional[str] = None
     
+    # Derived values keyed by the fields they came from. model_copy(update=...)
+    # copies private attrs without re-validating, so a bare cache would go stale
+    _api_params_cache: Optional[Tuple[tuple, Mapping[str, Any]]] = PrivateAttr(default=None)
+    
     @property
     def num_nights(self) -> int:
         return (self.departure_date - self.arrival_date).days
     
-    def to_api_params(self) -> dict:
+    @property
+    def api_params(self) -> Mapping[str, Any]:
+        """API request parameters (read-only, built once per target)"""
+        key = (self.campground_id, self.arrival_date, self.departure_date, self.num_people)
+        if self._api_params_cache is None or self._api_params_cache[0] != key:
+            self._api_params_cache = (key, MappingProxyType({
+                "campground_id": self.campground_id,
+                "start_date": self.arrival_date.isoformat(),
+                "end_date": self.departure_date.isoformat(),
+                "occupants": self.num_people,
+            }))
+        return self._api_params_cache[1]
+    
+    def to_api_params(self) -> Mapping[str, Any]:
         """Convert to API request parameters"""
-        return {
-            "campground_id": self.campground_id,
-            "start_date": self.arrival_date.isoformat(),
-            "end_date": self.departure_date.isoformat(),
-            "occupants": self.num_people,
-        }
+        return self.api_params
 
 
 class CartItem(BaseModel):
     """Item in Recreation.gov shopping cart"""
+    model_config = ConfigDict(frozen=True)
+    
     reservation_id: str
     campsite: Campsite
     arrival_date: date
@@ -157,15 +183,44 @@ class ReservationAttempt(BaseModel):
         self.error_message = error
 
 
-class SessionState(BaseModel):
-    """Browser/API session state"""
-    cookies: dict = Field(default_factory=dict)
-    local_storage: dict = Field(default_factory=dict)
+@dataclass(slots=True)
+class SessionState:
+    """Browser/API session state (plain dataclass, no validation overhead)"""
+    cookies: dict = field(default_factory=dict)
+    local_storage: dict = field(default_factory=dict)
     csrf_token: Optional[str] = None
     auth_token: Optional[str] = None
     logged_in: bool = False
     last_refresh: Optional[datetime] = None
     
+    def set_cookies(self, cookies: Dict[str, str]):
+        """Replace all cookies"""
+        self.cookies = dict(cookies)
+    
+    def update_cookies(self, cookies: Dict[str, str]):
+        """Add or overwrite cookies"""
+        self.cookies.update(cookies)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict (last_refresh as an ISO string)"""
+        return {
+            "cookies": dict(self.cookies),
+            "local_storage": dict(self.local_storage),
+            "csrf_token": self.csrf_token,
+            "auth_token": self.auth_token,
+            "logged_in": self.logged_in,
+            "last_refresh": self.last_refresh.isoformat() if self.last_refresh else None,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SessionState":
+        """Build from a to_dict() result, ignoring unknown keys"""
+        known = {f.name for f in fields(cls) if f.init}
+        values = {k: v for k, v in data.items() if k in known}
+        if isinstance(values.get("last_refresh"), str):
+            values["last_refresh"] = datetime.fromisoformat(values["last_refresh"])
+        return cls(**values)
+    
     def to_cookie_header(self) -> str:
         """Convert cookies to header string"""
         return "; ".join(f"{k}={v}" for k, v in self.cookies.items())
@@ -178,10 +233,14 @@ class SessionState(BaseModel):
         return age > max_age_seconds
 
 
-class NotificationPayload(BaseModel):
+@dataclass(slots=True)
+class NotificationPayload:
     """Notification content"""
     title: str
     message: str
     url: Optional[str] = None
     urgency: str = "normal"  # low, normal, high
     attempt: Optional[ReservationAttempt] = None
+    # Pre-rendered provider bodies, filled in once by NotificationManager
+    html_body: Optional[str] = None
+    slack_blocks: Optional[list] = None
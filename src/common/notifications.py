@@ -2,20 +2,108 @@
 Notification services for Recreation.gov bot
 """
 import asyncio
+import hashlib
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Optional
 import httpx
 
 from .models import NotificationPayload, ReservationAttempt
 from .config import NotificationsConfig
+from .jsonutil import HTTP2_AVAILABLE, dumps_bytes
 
 logger = logging.getLogger(__name__)
 
+SENDGRID_URL = "https://api.sendgrid.com/v3/mail/send"
+TWILIO_MESSAGES_URL = "https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """HTTP client shared by all notifiers so sends reuse warm connections"""
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(5.0, connect=2.0),
+        # Keep idle connections long enough to survive from prewarm() to use
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0),
+    )
+
+
+_HTML_MAIN = """
+    <html>
+    <body style="font-family: Arial, sans-serif; padding: 20px;">
+        <h1 style="color: %s;">
+            %s
+        </h1>
+        <p style="font-size: 16px;">%s</p>
+    """
+
+_HTML_URL = """
+        <p style="margin-top: 20px;">
+            <a href="%s" 
+               style="background: #2563eb; color: white; padding: 12px 24px; 
+                      text-decoration: none; border-radius: 6px; font-weight: bold;">
+                Complete Checkout →
+            </a>
+        </p>
+        <p style="color: #666; font-size: 14px; margin-top: 20px;">
+            ⏰ You have 15 minutes to complete your reservation!
+        </p>
+        """
+
+_HTML_END = """
+    </body>
+    </html>
+    """
+
+
+def render_email_html(payload: NotificationPayload) -> str:
+    """HTML email body for a payload"""
+    color = '#22c55e' if 'SUCCESS' in payload.title else '#ef4444'
+    main = _HTML_MAIN % (color, payload.title, payload.message)
+    return main + (_HTML_URL % payload.url if payload.url else "") + _HTML_END
+
+
+def render_slack_blocks(payload: NotificationPayload) -> list:
+    """Slack-compatible message blocks for a payload"""
+    return [
+        {
+            "type": "header",
+            "text": {"type": "plain_text", "text": payload.title}
+        },
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": payload.message}
+        },
+        *([{
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"<{payload.url}|Complete Checkout →>"
+            }
+        }] if payload.url else [])
+    ]
+
 
 class NotificationProvider(ABC):
     """Base class for notification providers"""
     
+    # URL on the provider's host to pre-dial before a time-critical send
+    prewarm_url: Optional[str] = None
+    # Extra attempts when the connection can't be opened. Only connect
+    # failures are retried: the request never reached the provider, so a
+    # resend can't deliver the message twice
+    connect_retries: int = 1
+    
+    async def _post(self, url: str, **kwargs) -> httpx.Response:
+        """POST via self.client, retrying only failures to connect"""
+        for retries_left in range(self.connect_retries, -1, -1):
+            try:
+                return await self.client.post(url, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if not retries_left:
+                    raise
+    
     @abstractmethod
     async def send(self, payload: NotificationPayload) -> bool:
         """Send notification, return True if successful"""
@@ -25,21 +113,31 @@ class NotificationProvider(ABC):
 class EmailNotifier(NotificationProvider):
     """SendGrid email notifications"""
     
-    def __init__(self, api_key: str, to_address: str, from_address: str = "noreply@recgov-bot.local"):
+    def __init__(
+        self,
+        api_key: str,
+        to_address: str,
+        from_address: str = "noreply@recgov-bot.local",
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.api_key = api_key
         self.to_address = to_address
         self.from_address = from_address
-        self.client = httpx.AsyncClient()
+        self.client = client or create_http_client()
+        # Request constants, built once rather than on every send
+        self._url = SENDGRID_URL
+        self.prewarm_url = SENDGRID_URL
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
     
     async def send(self, payload: NotificationPayload) -> bool:
         try:
-            response = await self.client.post(
-                "https://api.sendgrid.com/v3/mail/send",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
+            response = await self._post(
+                self._url,
+                headers=self._headers,
+                content=dumps_bytes({
                     "personalizations": [{"to": [{"email": self.to_address}]}],
                     "from": {"email": self.from_address, "name": "RecGov Bot"},
                     "subject": payload.title,
@@ -49,60 +147,50 @@ class EmailNotifier(NotificationProvider):
                             "value": self._format_html(payload)
                         }
                     ]
-                }
+                })
             )
             success = response.status_code in (200, 202)
             if not success:
-                logger.error(f"Email send failed: {response.status_code} - {response.text}")
+                logger.error(
+                    "Email send failed: %s - %s",
+                    response.status_code,
+                    response.text,
+                )
             return success
         except Exception as e:
-            logger.error(f"Email send error: {e}")
+            logger.error("Email send error: %s", e)
             return False
     
     def _format_html(self, payload: NotificationPayload) -> str:
-        html = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; padding: 20px;">
-            <h1 style="color: {'#22c55e' if 'SUCCESS' in payload.title else '#ef4444'};">
-                {payload.title}
-            </h1>
-            <p style="font-size: 16px;">{payload.message}</p>
-        """
-        if payload.url:
-            html += f"""
-            <p style="margin-top: 20px;">
-                <a href="{payload.url}" 
-                   style="background: #2563eb; color: white; padding: 12px 24px; 
-                          text-decoration: none; border-radius: 6px; font-weight: bold;">
-                    Complete Checkout →
-                </a>
-            </p>
-            <p style="color: #666; font-size: 14px; margin-top: 20px;">
-                ⏰ You have 15 minutes to complete your reservation!
-            </p>
-            """
-        html += """
-        </body>
-        </html>
-        """
-        return html
+        return payload.html_body or render_email_html(payload)
 
 
 class SMSNotifier(NotificationProvider):
     """Twilio SMS notifications"""
     
-    def __init__(self, account_sid: str, auth_token: str, from_number: str, to_number: str):
+    def __init__(
+        self,
+        account_sid: str,
+        auth_token: str,
+        from_number: str,
+        to_number: str,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.account_sid = account_sid
         self.auth_token = auth_token
         self.from_number = from_number
         self.to_number = to_number
-        self.client = httpx.AsyncClient()
+        self.client = client or create_http_client()
+        # Request constants, built once rather than on every send
+        self._url = TWILIO_MESSAGES_URL.format(account_sid=account_sid)
+        self.prewarm_url = self._url
+        self._auth = (account_sid, auth_token)
     
     async def send(self, payload: NotificationPayload) -> bool:
         try:
-            response = await self.client.post(
-                f"https://api.twilio.com/2010-04-01/Accounts/{self.account_sid}/Messages.json",
-                auth=(self.account_sid, self.auth_token),
+            response = await self._post(
+                self._url,
+                auth=self._auth,
                 data={
                     "From": self.from_number,
                     "To": self.to_number,
@@ -111,10 +199,14 @@ class SMSNotifier(NotificationProvider):
             )
             success = response.status_code == 201
             if not success:
-                logger.error(f"SMS send failed: {response.status_code} - {response.text}")
+                logger.error(
+                    "SMS send failed: %s - %s",
+                    response.status_code,
+                    response.text,
+                )
             return success
         except Exception as e:
-            logger.error(f"SMS send error: {e}")
+            logger.error("SMS send error: %s", e)
             return False
     
     def _format_sms(self, payload: NotificationPayload) -> str:
@@ -127,39 +219,29 @@ class SMSNotifier(NotificationProvider):
 class WebhookNotifier(NotificationProvider):
     """Generic webhook notifications (Slack, Discord, etc.)"""
     
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, client: Optional[httpx.AsyncClient] = None):
         self.webhook_url = webhook_url
-        self.client = httpx.AsyncClient()
+        self.prewarm_url = webhook_url
+        self.client = client or create_http_client()
+        self._headers = {"Content-Type": "application/json"}
     
     async def send(self, payload: NotificationPayload) -> bool:
         try:
             # Format for Slack-compatible webhooks
-            response = await self.client.post(
+            response = await self._post(
                 self.webhook_url,
-                json={
+                headers=self._headers,
+                content=dumps_bytes({
                     "text": payload.title,
-                    "blocks": [
-                        {
-                            "type": "header",
-                            "text": {"type": "plain_text", "text": payload.title}
-                        },
-                        {
-                            "type": "section",
-                            "text": {"type": "mrkdwn", "text": payload.message}
-                        },
-                        *([{
-                            "type": "section",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": f"<{payload.url}|Complete Checkout →>"
-                            }
-                        }] if payload.url else [])
-                    ]
-                }
+                    "blocks": payload.slack_blocks or render_slack_blocks(payload)
+                })
             )
-            return response.status_code == 200
+            success = response.status_code == 200
+            if not success:
+                logger.error("Webhook send failed: %s", response.status_code)
+            return success
         except Exception as e:
-            logger.error(f"Webhook send error: {e}")
+            logger.error("Webhook send error: %s", e)
             return False
 
 
@@ -167,6 +249,10 @@ class ConsoleNotifier(NotificationProvider):
     """Console output for testing"""
     
     async def send(self, payload: NotificationPayload) -> bool:
+        return self.emit(payload)
+    
+    def emit(self, payload: NotificationPayload) -> bool:
+        """Print synchronously; there is nothing to await"""
         print("\n" + "=" * 60)
         print(f"📢 {payload.title}")
         print("-" * 60)
@@ -180,8 +266,20 @@ class ConsoleNotifier(NotificationProvider):
 class NotificationManager:
     """Manages multiple notification providers"""
     
+    # Per-provider send deadline (seconds) and how many sends run at once
+    send_timeout: float = 3.0
+    max_concurrent_sends: int = 4
+    # Identical non-urgent notifications within this many seconds are dropped
+    debounce_window: float = 30.0
+    
     def __init__(self, config: NotificationsConfig):
         self.providers: list[NotificationProvider] = []
+        # One pooled client for every HTTP-based provider
+        self.client = create_http_client()
+        # In-flight sends; holds strong refs so tasks aren't garbage collected
+        self._bg_tasks: set[asyncio.Task] = set()
+        # Message digest -> monotonic time it was last sent
+        self._recent: dict[str, float] = {}
         
         # Always add console notifier
         self.providers.append(ConsoleNotifier())
@@ -190,7 +288,8 @@ class NotificationManager:
         if config.email.enabled and config.email.sendgrid_api_key and config.email.address:
             self.providers.append(EmailNotifier(
                 api_key=config.email.sendgrid_api_key,
-                to_address=config.email.address
+                to_address=config.email.address,
+                client=self.client
             ))
             logger.info("Email notifications enabled")
         elif config.email.enabled:
@@ -207,18 +306,45 @@ class NotificationManager:
                 account_sid=config.sms.twilio_account_sid,
                 auth_token=config.sms.twilio_auth_token,
                 from_number=config.sms.twilio_from_number,
-                to_number=config.sms.phone
+                to_number=config.sms.phone,
+                client=self.client
             ))
             logger.info("SMS notifications enabled")
         elif config.sms.enabled:
             logger.warning("SMS notifications enabled but missing Twilio config")
         
         if config.webhook.enabled and config.webhook.url:
-            self.providers.append(WebhookNotifier(config.webhook.url))
+            self.providers.append(WebhookNotifier(config.webhook.url, client=self.client))
             logger.info("Webhook notifications enabled")
         elif config.webhook.enabled:
             logger.warning("Webhook notifications enabled but missing URL")
     
+    async def prewarm(self):
+        """Open connections to each provider's host so a send skips the TLS handshake"""
+        origins = {
+            str(httpx.URL(p.prewarm_url).join("/"))
+            for p in self.providers
+            if isinstance(p, NotificationProvider) and p.prewarm_url
+        }
+        
+        async def dial(url: str):
+            try:
+                await self.client.head(url, timeout=2.0)
+            except Exception as e:
+                logger.debug("Prewarm of %s failed: %s", url, e)
+        
+        await asyncio.gather(*[dial(url) for url in origins])
+    
+    async def drain(self):
+        """Wait for any in-flight notifications to finish"""
+        while self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+    
+    async def aclose(self):
+        """Flush pending notifications and close the shared HTTP client"""
+        await self.drain()
+        await self.client.aclose()
+    
     async def notify_success(self, attempt: ReservationAttempt):
         """Send success notification"""
         payload = NotificationPayload(
@@ -233,7 +359,7 @@ class NotificationManager:
             urgency="high",
             attempt=attempt
         )
-        await self._send_all(payload)
+        self._send_all(payload)
     
     async def notify_failure(self, attempt: ReservationAttempt):
         """Send failure notification"""
@@ -247,7 +373,7 @@ class NotificationManager:
             urgency="normal",
             attempt=attempt
         )
-        await self._send_all(payload)
+        self._send_all(payload)
     
     async def notify_captcha(self, url: str):
         """Notify user that CAPTCHA intervention is needed"""
@@ -257,7 +383,7 @@ class NotificationManager:
             url=url,
             urgency="high"
         )
-        await self._send_all(payload)
+        self._send_all(payload)
     
     async def notify_starting(self, attempt: ReservationAttempt):
         """Notify that reservation attempt is starting"""
@@ -270,14 +396,69 @@ class NotificationManager:
             ),
             urgency="normal"
         )
-        await self._send_all(payload)
+        self._send_all(payload)
     
-    async def _send_all(self, payload: NotificationPayload):
+    def _send_all(self, payload: NotificationPayload) -> Optional[asyncio.Task]:
+        """
+        Dispatch a notification in the background and return immediately.
+        
+        Keeps provider latency off the reservation path; use drain() to wait.
+        Returns None if the notification was dropped as a recent duplicate.
+        """
+        if self._is_duplicate(payload):
+            logger.debug("Dropping duplicate notification: %s", payload.title)
+            return None
+        
+        task = asyncio.create_task(self._do_send_all(payload))
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+    
+    def _is_duplicate(self, payload: NotificationPayload) -> bool:
+        """Debounce repeats of the same message; high urgency always goes out"""
+        if payload.urgency == "high":
+            return False
+        
+        now = time.monotonic()
+        # Forget entries outside the window so the map stays small
+        self._recent = {
+            k: t for k, t in self._recent.items() if now - t < self.debounce_window
+        }
+        key = hashlib.blake2b(
+            (payload.title + payload.message).encode(), digest_size=8
+        ).hexdigest()
+        if key in self._recent:
+            return True
+        self._recent[key] = now
+        return False
+    
+    async def _do_send_all(self, payload: NotificationPayload):
         """Send notification through all providers"""
-        results = await asyncio.gather(
-            *[p.send(payload) for p in self.providers],
+        # Render provider bodies once instead of once per provider
+        if payload.html_body is None and any(isinstance(p, EmailNotifier) for p in self.providers):
+            payload.html_body = render_email_html(payload)
+        if payload.slack_blocks is None and any(isinstance(p, WebhookNotifier) for p in self.providers):
+            payload.slack_blocks = render_slack_blocks(payload)
+        
+        semaphore = asyncio.Semaphore(self.max_concurrent_sends)
+        
+        async def guarded_send(provider: NotificationProvider) -> bool:
+            # Cap each provider so one stalled service can't hold up the rest
+            async with semaphore:
+                return await asyncio.wait_for(provider.send(payload), timeout=self.send_timeout)
+        
+        # Console output is plain printing: do it inline rather than as a task
+        results = [p.emit(payload) for p in self.providers if isinstance(p, ConsoleNotifier)]
+        results += await asyncio.gather(
+            *[guarded_send(p) for p in self.providers if not isinstance(p, ConsoleNotifier)],
             return_exceptions=True
         )
         
         success_count = sum(1 for r in results if r is True)
-        logger.info(f"Notifications sent: {success_count}/{len(self.providers)} successful")
+        timeout_count = sum(1 for r in results if isinstance(r, asyncio.TimeoutError))
+        logger.info(
+            "Notifications sent: %d/%d successful%s",
+            success_count,
+            len(self.providers),
+            f", {timeout_count} timed out" if timeout_count else ""
+        )
@@ -4,11 +4,12 @@ Precision scheduler for Recreation.gov bot
 Handles timing-critical operations with millisecond accuracy.
 """
 import asyncio
+import random
 import time
 import logging
 from datetime import datetime, timedelta
 from typing import Callable, Awaitable, Optional
-import pytz
+from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +21,19 @@ class PrecisionScheduler:
     Uses a combination of sleep and busy-wait for accuracy.
     """
     
+    # Seconds between wall-clock re-checks while waiting
+    REANCHOR_INTERVAL = 30.0
+    
     def __init__(self, timezone: str = "America/Los_Angeles"):
-        self.tz = pytz.timezone(timezone)
+        self.tz = ZoneInfo(timezone)
         self._cancelled = False
+        # (seconds before target, callback) fired once per wait_until
+        self._prewarms: list[tuple[float, Callable[[], Awaitable]]] = []
+        self._prewarm_tasks: set[asyncio.Task] = set()
+    
+    def _monotonic_deadline(self, target: datetime) -> float:
+        """time.monotonic() value corresponding to a tz-aware wall-clock target"""
+        return time.monotonic() + (target - datetime.now(self.tz)).total_seconds()
     
     def now(self) -> datetime:
         """Get current time in configured timezone"""
@@ -32,6 +43,18 @@ class PrecisionScheduler:
         """Cancel any pending waits"""
         self._cancelled = True
     
+    def add_prewarm(self, callback: Callable[[], Awaitable], seconds_before: float = 10):
+        """
+        Run callback in the background once a wait gets within seconds_before
+        of its target, e.g. to open connections ahead of the critical moment.
+        """
+        self._prewarms.append((seconds_before, callback))
+    
+    def _fire_prewarm(self, callback: Callable[[], Awaitable]):
+        task = asyncio.create_task(callback())
+        self._prewarm_tasks.add(task)
+        task.add_done_callback(self._prewarm_tasks.discard)
+    
     async def wait_until(
         self, 
         target: datetime,
@@ -53,21 +76,35 @@ class PrecisionScheduler:
         
         # Ensure target is timezone-aware
         if target.tzinfo is None:
-            target = self.tz.localize(target)
+            target = target.replace(tzinfo=self.tz)
         
         # Adjust for early start
         adjusted_target = target - timedelta(milliseconds=early_ms)
         
         logger.info(f"Waiting until {target.isoformat()} (adjusted: {adjusted_target.isoformat()})")
         
+        # Count down on the monotonic clock so the loop (and especially the
+        # final spin) never builds tz-aware datetimes and isn't thrown off by
+        # NTP steps. On long waits, re-anchor to the wall clock periodically
+        # to pick up drift between the two clocks.
+        deadline = self._monotonic_deadline(adjusted_target)
+        next_anchor = time.monotonic() + self.REANCHOR_INTERVAL
+        pending_prewarms = sorted(self._prewarms, key=lambda p: p[0], reverse=True)
+        
         while not self._cancelled:
-            now = datetime.now(self.tz)
-            remaining = (adjusted_target - now).total_seconds()
+            now_mono = time.monotonic()
+            if now_mono >= next_anchor:
+                deadline = self._monotonic_deadline(adjusted_target)
+                next_anchor = now_mono + self.REANCHOR_INTERVAL
+            remaining = deadline - now_mono
             
             if remaining <= 0:
                 logger.info("Target time reached!")
                 return True
             
+            while pending_prewarms and remaining <= pending_prewarms[0][0]:
+                self._fire_prewarm(pending_prewarms.pop(0)[1])
+            
             if callback:
                 callback()
             
@@ -79,14 +116,16 @@ class PrecisionScheduler:
                 # 5-60 seconds: sleep in 1-second chunks
                 await asyncio.sleep(1)
             elif remaining > 0.5:
-                # 0.5-5 seconds: sleep in 100ms chunks
-                await asyncio.sleep(0.1)
+                # 0.5-5 seconds: sleep to ~50ms out (at most 1s per step)
+                await asyncio.sleep(min(remaining - 0.05, 1.0))
             elif remaining > 0.01:
-                # 10ms - 500ms: sleep in 1ms chunks
-                await asyncio.sleep(0.001)
+                # 10ms - 500ms: one sleep to ~5ms out instead of polling,
+                # then the busy-wait below takes over
+                await asyncio.sleep(remaining - 0.005)
             else:
                 # Under 10ms: busy-wait for precision
-                while (adjusted_target - datetime.now(self.tz)).total_seconds() > 0:
+                deadline_ns = time.monotonic_ns() + int(remaining * 1e9)
+                while time.monotonic_ns() < deadline_ns:
                     pass
                 return True
         
@@ -116,7 +155,7 @@ class PrecisionScheduler:
         """Get timedelta until target"""
         now = datetime.now(self.tz)
         if target.tzinfo is None:
-            target = self.tz.localize(target)
+            target = target.replace(tzinfo=self.tz)
         return target - now
     
     def format_countdown(self, target: datetime) -> str:
@@ -127,50 +166,53 @@ class PrecisionScheduler:
         if total_seconds < 0:
             return "NOW!"
         
-        days = total_seconds // 86400
-        hours = (total_seconds % 86400) // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        
-        parts = []
-        if days > 0:
-            parts.append(f"{days}d")
-        if hours > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0:
-            parts.append(f"{minutes}m")
-        parts.append(f"{seconds}s")
-        
-        return " ".join(parts)
+        days, rem = divmod(total_seconds, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes, seconds = divmod(rem, 60)
+        
+        # Start at the largest non-zero unit and show every unit below it
+        if days:
+            return f"{days}d {hours}h {minutes}m {seconds}s"
+        if hours:
+            return f"{hours}h {minutes}m {seconds}s"
+        if minutes:
+            return f"{minutes}m {seconds}s"
+        return f"{seconds}s"
 
 
 class RateLimiter:
     """
     Rate limiter for API requests.
     
-    Uses token bucket algorithm.
+    Uses token bucket algorithm. It only paces when requests start: nothing
+    is held while the request itself runs, so concurrent callers overlap.
     """
     
     def __init__(self, requests_per_second: float = 2.0):
         self.rate = requests_per_second
         self.tokens = requests_per_second
         self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
     
     async def acquire(self):
         """Wait until a request can be made"""
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self.last_update
-            self.tokens = min(self.rate, self.tokens + elapsed * self.rate)
-            self.last_update = now
-            
-            if self.tokens < 1:
-                wait_time = (1 - self.tokens) / self.rate
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-            else:
-                self.tokens -= 1
+        # No lock needed: the bookkeeping below has no await in it, so on a
+        # single event loop it runs atomically with respect to other callers
+        now = time.monotonic()
+        # last_update is in the future while reserved slots are pending
+        elapsed = max(0.0, now - self.last_update)
+        self.tokens = min(self.rate, self.tokens + elapsed * self.rate)
+        self.last_update = max(now, self.last_update)
+        
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return
+        
+        # Reserve the next free slot, then wait for it
+        deadline = self.last_update + (1 - self.tokens) / self.rate
+        self.last_update = deadline
+        self.tokens = 0
+        
+        await asyncio.sleep(deadline - now)
     
     async def __aenter__(self):
         await self.acquire()
@@ -190,13 +232,16 @@ class RetryStrategy:
         max_attempts: int = 10,
         base_delay_ms: int = 100,
         max_delay_ms: int = 5000,
-        exponential_backoff: bool = False
+        exponential_backoff: bool = False,
+        jitter: bool = False
     ):
         self.max_attempts = max_attempts
         self.base_delay_ms = base_delay_ms
         self.max_delay_ms = max_delay_ms
         self.exponential_backoff = exponential_backoff
+        self.jitter = jitter
         self.attempts = 0
+        self._prev_delay_ms = base_delay_ms
     
     def should_retry(self) -> bool:
         """Check if another attempt should be made"""
@@ -206,9 +251,29 @@ class RetryStrategy:
         """Record an attempt"""
         self.attempts += 1
     
-    async def wait(self):
-        """Wait appropriate time before next attempt"""
-        if self.exponential_backoff:
+    async def wait(self, retry_after_s: Optional[float] = None):
+        """
+        Wait appropriate time before next attempt.
+        
+        A server-provided Retry-After value takes precedence, capped at
+        max_delay_ms so a large header can't stall the booking window. With
+        jitter enabled, uses decorrelated jitter so competing clients don't
+        retry in lockstep.
+        """
+        if retry_after_s is not None:
+            cap_s = self.max_delay_ms / 1000
+            if retry_after_s > cap_s:
+                logger.warning(f"Retry-After {retry_after_s}s exceeds cap, waiting {cap_s}s")
+            await asyncio.sleep(min(max(0.0, retry_after_s), cap_s))
+            return
+        
+        if self.jitter:
+            delay_ms = random.uniform(
+                self.base_delay_ms,
+                min(self.max_delay_ms, self._prev_delay_ms * 3)
+            )
+            self._prev_delay_ms = delay_ms
+        elif self.exponential_backoff:
             delay_ms = min(
                 self.base_delay_ms * (2 ** (self.attempts - 1)),
                 self.max_delay_ms
@@ -221,6 +286,7 @@ class RetryStrategy:
     def reset(self):
         """Reset attempt counter"""
         self.attempts = 0
+        self._prev_delay_ms = self.base_delay_ms
 
 
 async def countdown_display(
@@ -237,15 +303,21 @@ async def countdown_display(
     from rich.text import Text
     from rich.panel import Panel
     
-    with Live(refresh_per_second=4) as live:
+    # Poll at Rich's usual 4 Hz but only re-render when the text changes
+    poll_interval = min(update_interval, 0.25)
+    last_countdown = None
+    
+    with Live(auto_refresh=False) as live:
         while scheduler.time_until(target).total_seconds() > 0:
             countdown = scheduler.format_countdown(target)
-            panel = Panel(
-                Text(countdown, style="bold green", justify="center"),
-                title="⏰ Reservation Window Opens In",
-                border_style="green"
-            )
-            live.update(panel)
-            await asyncio.sleep(update_interval)
+            if countdown != last_countdown:
+                panel = Panel(
+                    Text(countdown, style="bold green", justify="center"),
+                    title="⏰ Reservation Window Opens In",
+                    border_style="green"
+                )
+                live.update(panel, refresh=True)
+                last_countdown = countdown
+            await asyncio.sleep(poll_interval)
     
     print("🚀 GO TIME!")
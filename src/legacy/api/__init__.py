@@ -1,13 +1,14 @@
 """
 Recreation.gov Direct API Module
 """
-from .client import RecGovAPIClient, APIError
+from .client import RecGovAPIClient, APIError, RateLimitedError
 from .auth import RecGovAuth, AuthenticationError
 from .endpoints import Endpoints, WebPages, DEFAULT_HEADERS
 
 __all__ = [
     "RecGovAPIClient",
     "APIError",
+    "RateLimitedError",
     "RecGovAuth",
     "AuthenticationError",
     "Endpoints",
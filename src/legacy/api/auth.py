@@ -3,6 +3,7 @@ Authentication handling for Recreation.gov API
 """
 import json
 import logging
+from datetime import datetime
 from typing import Optional, Tuple
 from pathlib import Path
 import httpx
@@ -59,7 +60,7 @@ class RecGovAuth:
             
             if response.status_code == 200:
                 # Extract cookies
-                self.session.cookies = dict(response.cookies)
+                self.session.set_cookies(response.cookies)
                 
                 # Check for auth token in response
                 try:
@@ -70,7 +71,7 @@ class RecGovAuth:
                     pass
                 
                 self.session.logged_in = True
-                self.session.last_refresh = __import__('datetime').datetime.now()
+                self.session.last_refresh = datetime.now()
                 
                 logger.info("Login successful")
                 
@@ -99,7 +100,7 @@ class RecGovAuth:
         """Initialize session by visiting homepage to get cookies"""
         try:
             response = await self.client.get("https://www.recreation.gov")
-            self.session.cookies.update(dict(response.cookies))
+            self.session.update_cookies(response.cookies)
             
             # Try to get CSRF token
             csrf_response = await self.client.get(Endpoints.csrf_token())
@@ -134,8 +135,8 @@ class RecGovAuth:
                 "https://www.recreation.gov",
                 cookies=self.session.cookies
             )
-            self.session.cookies.update(dict(response.cookies))
-            self.session.last_refresh = __import__('datetime').datetime.now()
+            self.session.update_cookies(response.cookies)
+            self.session.last_refresh = datetime.now()
             self._save_session()
             return True
         except Exception as e:
@@ -164,7 +165,7 @@ class RecGovAuth:
         try:
             self.session_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self.session_file, 'w') as f:
-                json.dump(self.session.model_dump(), f)
+                json.dump(self.session.to_dict(), f)
             logger.debug(f"Session saved to {self.session_file}")
         except Exception as e:
             logger.warning(f"Failed to save session: {e}")
@@ -177,7 +178,7 @@ class RecGovAuth:
         try:
             with open(self.session_file) as f:
                 data = json.load(f)
-            self.session = SessionState(**data)
+            self.session = SessionState.from_dict(data)
             logger.info(f"Session loaded from {self.session_file}")
             return self.session
         except Exception as e:
@@ -6,8 +6,10 @@ Uses reverse-engineered endpoints - may break if Recreation.gov changes their AP
 """
 import asyncio
 import logging
-from datetime import datetime, date
-from typing import Optional, List, Dict, Any
+import time
+from datetime import datetime, date, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Dict, Any, Tuple
 import httpx
 
 from .endpoints import Endpoints, DEFAULT_HEADERS, WebPages, CartAddRequest
@@ -24,11 +26,19 @@ from ...common.models import (
     CartItem,
 )
 from ...common.config import Config
-from ...common.scheduler import RateLimiter, RetryStrategy
+from ...common.jsonutil import HTTP2_AVAILABLE, dumps_bytes, loads
+from ...common.scheduler import PrecisionScheduler, RateLimiter, RetryStrategy
 from ...common.notifications import NotificationManager
 
+
 logger = logging.getLogger(__name__)
 
+# API status string -> enum, without raising on unknown statuses
+_STATUS_MAP = {status.value: status for status in CampsiteAvailability}
+
+# How long Recreation.gov holds a site in the cart
+_CART_TTL = timedelta(minutes=15)
+
 
 class APIError(Exception):
     """Raised when API request fails"""
@@ -38,6 +48,29 @@ class APIError(Exception):
         self.response_body = response_body
 
 
+class RateLimitedError(APIError):
+    """Raised on 429/503; retry_after is the server's Retry-After in seconds, if any"""
+    def __init__(self, message: str, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(message, status_code)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
 class RecGovAPIClient:
     """
     Direct API client for Recreation.gov.
@@ -46,16 +79,35 @@ class RecGovAPIClient:
     but is more fragile and may trigger bot detection.
     """
     
+    # How long (seconds) a prewarm() availability result stays usable
+    PREWARM_MAX_AGE = 10.0
+    
     def __init__(self, config: Config):
         self.config = config
         self.auth = RecGovAuth(session_file=config.browser.session_file)
         self.rate_limiter = RateLimiter(config.api.requests_per_second)
+        # HTTP/2 lets concurrent availability/cart requests share one warm
+        # connection; keepalive keeps it open between bursts
         self.client = httpx.AsyncClient(
             headers=DEFAULT_HEADERS,
             timeout=config.api.timeout,
-            follow_redirects=True
+            follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30
+            )
         )
         self.notifications: Optional[NotificationManager] = None
+        # Session cookies for requests; auth headers live on self.client
+        self._auth_cookies: Optional[Dict[str, str]] = None
+        # (monotonic fetch time, ReservationTarget, results) from prewarm()
+        self._prewarmed_sites: Optional[Tuple[float, ReservationTarget, List[CampsiteAvailabilityResult]]] = None
+        # Serializes re-logins after a 401; the epoch counts completed
+        # re-logins so callers can tell whether one already happened
+        self._login_lock = asyncio.Lock()
+        self._login_epoch = 0
     
     async def __aenter__(self):
         return self
@@ -67,8 +119,27 @@ class RecGovAPIClient:
     # Authentication
     # ========================================
     
+    @property
+    def auth_cookies(self) -> Dict[str, str]:
+        """
+        Session cookies, snapshotted once per login.
+        
+        Taking the snapshot also installs the auth headers on the client
+        itself, so hot requests don't rebuild or pass them per call.
+        """
+        if self._auth_cookies is None:
+            self.client.headers.update(self.auth.get_auth_headers())
+            self._auth_cookies = self.auth.get_cookies()
+        return self._auth_cookies
+    
+    def _invalidate_auth(self):
+        """Drop the auth snapshot after the session changes or is rejected"""
+        self._auth_cookies = None
+        self.client.headers = httpx.Headers(DEFAULT_HEADERS)
+    
     async def login(self) -> bool:
         """Login with configured credentials"""
+        self._invalidate_auth()
         try:
             # Try to load existing session first
             existing = self.auth.load_session()
@@ -87,6 +158,21 @@ class RecGovAPIClient:
             logger.error(f"Login failed: {e}")
             return False
     
+    async def _relogin(self, seen_epoch: int) -> bool:
+        """
+        Re-login after a rejected request, once per session expiry.
+        
+        seen_epoch is _login_epoch from before the failed request. When
+        several requests hit the same expiry, only the first logs in again;
+        the rest find the epoch moved on and reuse the new session.
+        """
+        async with self._login_lock:
+            if self._login_epoch != seen_epoch:
+                return True
+            ok = await self.login()
+            self._login_epoch += 1
+            return ok
+    
     # ========================================
     # Availability Checking
     # ========================================
@@ -112,8 +198,7 @@ class RecGovAPIClient:
             
             response = await self.client.get(
                 url,
-                cookies=self.auth.get_cookies(),
-                headers=self.auth.get_auth_headers()
+                cookies=self.auth_cookies
             )
             
             if response.status_code != 200:
@@ -123,7 +208,7 @@ class RecGovAPIClient:
                     response.text
                 )
             
-            data = response.json()
+            data = loads(response.content)
             results = {}
             
             for site_id, site_data in data.get("campsites", {}).items():
@@ -138,25 +223,25 @@ class RecGovAPIClient:
                 )
                 
                 availabilities = []
-                for date_str, status in site_data.get("availabilities", {}).items():
+                # ISO date keys sort chronologically as plain strings, so
+                # order the keys instead of the built slots (no key function)
+                for date_str, status in sorted(site_data.get("availabilities", {}).items()):
                     try:
-                        slot_date = datetime.fromisoformat(
-                            date_str.replace("Z", "+00:00")
-                        ).date()
-                        try:
-                            availability_status = CampsiteAvailability(status)
-                        except ValueError:
-                            availability_status = CampsiteAvailability.NOT_AVAILABLE
-                        availabilities.append(AvailabilitySlot(
-                            date=slot_date,
-                            status=availability_status
-                        ))
-                    except (ValueError, KeyError):
+                        # Keys are always "YYYY-MM-DDT00:00:00Z"; slicing the
+                        # date out is much cheaper than fromisoformat
+                        slot_date = date(
+                            int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])
+                        )
+                    except ValueError:
                         continue
+                    availabilities.append(AvailabilitySlot(
+                        date=slot_date,
+                        status=_STATUS_MAP.get(status, CampsiteAvailability.NOT_AVAILABLE)
+                    ))
                 
                 results[site_id] = CampsiteAvailabilityResult(
                     campsite=campsite,
-                    availabilities=sorted(availabilities, key=lambda x: x.date)
+                    availabilities=availabilities
                 )
             
             return results
@@ -170,25 +255,29 @@ class RecGovAPIClient:
         
         Returns sites in priority order (if campsite_ids specified) or all available.
         """
-        # Get availability for the relevant month(s)
-        months_needed = set()
-        current = target.arrival_date
-        while current <= target.departure_date:
-            months_needed.add(current.replace(day=1))
-            current = date(
-                current.year + (current.month // 12),
-                (current.month % 12) + 1,
-                1
-            )
+        # Months covering every night of the stay; the departure day itself
+        # isn't a night, so a stay ending on the 1st doesn't need that month
+        first = target.arrival_date.replace(day=1)
+        last = max(target.departure_date - timedelta(days=1), target.arrival_date).replace(day=1)
+        months = [first]
+        while months[-1] < last:
+            cur = months[-1]
+            months.append(date(cur.year + 1, 1, 1) if cur.month == 12 else date(cur.year, cur.month + 1, 1))
         
-        # Fetch availability for each month
+        # Fetch all months concurrently; they share the pooled connection.
+        # Let every fetch finish before surfacing a failure so none is left
+        # running unobserved
+        monthly = await asyncio.gather(*[
+            self.get_campground_availability(target.campground_id, month)
+            for month in months
+        ], return_exceptions=True)
+        for result in monthly:
+            if isinstance(result, BaseException):
+                raise result
+        
+        # Merge results in month order so slots stay date-sorted
         all_availability = {}
-        for month in months_needed:
-            availability = await self.get_campground_availability(
-                target.campground_id,
-                month
-            )
-            # Merge results
+        for availability in monthly:
             for site_id, result in availability.items():
                 if site_id not in all_availability:
                     all_availability[site_id] = result
@@ -214,6 +303,42 @@ class RecGovAPIClient:
         logger.info(f"Found {len(available)} available sites")
         return available
     
+    async def prewarm(self, target: ReservationTarget, lead_ms: int = 2000) -> bool:
+        """
+        Log in, prefetch availability, then wait for the booking window.
+        
+        Login runs while waiting, availability is fetched lead_ms before
+        the window opens, and this returns once the window is open
+        (adjusted by schedule.early_start_ms, as in the browser bot), so
+        the caller can start the add-to-cart burst right away.
+        attempt_reservation reuses the fetched availability while it is
+        fresh. Returns False if login failed (nothing is fetched then).
+        """
+        schedule = self.config.schedule
+        scheduler = PrecisionScheduler(schedule.timezone)
+        logged_in, _ = await asyncio.gather(
+            self.login(),
+            scheduler.wait_until(schedule.window_datetime, early_ms=lead_ms)
+        )
+        if not logged_in:
+            return False
+        available = await self.find_available_sites(target)
+        self._prewarmed_sites = (time.monotonic(), target, available)
+        await scheduler.wait_until(schedule.window_datetime, early_ms=schedule.early_start_ms)
+        return True
+    
+    def _take_prewarmed_sites(self, target: ReservationTarget) -> Optional[List[CampsiteAvailabilityResult]]:
+        """Prewarmed availability for target if still fresh (single use)"""
+        prewarmed, self._prewarmed_sites = self._prewarmed_sites, None
+        if prewarmed is None:
+            return None
+        fetched_at, prewarmed_target, available = prewarmed
+        if prewarmed_target != target or time.monotonic() - fetched_at > self.PREWARM_MAX_AGE:
+            return None
+        # Before the window opens sites may all show as unreservable, so an
+        # empty prefetch says nothing; look again live
+        return available or None
+    
     # ========================================
     # Cart Operations
     # ========================================
@@ -223,35 +348,36 @@ class RecGovAPIClient:
         campsite_id: str,
         facility_id: str,
         arrival_date: date,
-        departure_date: date
+        departure_date: date,
+        body_bytes: Optional[bytes] = None
     ) -> Optional[CartItem]:
         """
         Add a campsite reservation to cart.
         
         This is the critical path - must be as fast as possible.
+        Pass body_bytes (from cart_request_body) to skip rebuilding and
+        re-serializing the same request on every retry.
         
         Returns:
             CartItem if successful, None if failed
         """
-        async with self.rate_limiter:
-            request = CartAddRequest(
-                campsite_id=campsite_id,
-                facility_id=facility_id,
-                arrival_date=arrival_date.isoformat(),
-                departure_date=departure_date.isoformat()
+        if body_bytes is None:
+            body_bytes = self.cart_request_body(
+                campsite_id, facility_id, arrival_date, departure_date
             )
-            
+        
+        async with self.rate_limiter:
             logger.info(f"Adding campsite {campsite_id} to cart...")
             
+            # Auth headers already carry Content-Type: application/json
             response = await self.client.post(
                 Endpoints.add_to_cart(),
-                json=request.to_dict(),
-                cookies=self.auth.get_cookies(),
-                headers=self.auth.get_auth_headers()
+                content=body_bytes,
+                cookies=self.auth_cookies
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = loads(response.content)
                 logger.info(f"Successfully added to cart!")
                 
                 # Parse cart item from response
@@ -268,7 +394,7 @@ class RecGovAPIClient:
                     subtotal=data.get("subtotal", 0),
                     fees=data.get("fees", 0),
                     total=data.get("total", 0),
-                    expires_at=datetime.now() + __import__('datetime').timedelta(minutes=15)
+                    expires_at=datetime.now() + _CART_TTL
                 )
             
             elif response.status_code == 409:
@@ -278,19 +404,40 @@ class RecGovAPIClient:
             
             elif response.status_code == 401:
                 logger.error("Session expired during add to cart")
+                self._invalidate_auth()
                 raise AuthenticationError("Session expired")
             
+            elif response.status_code in (429, 503):
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                logger.warning(f"Add to cart throttled ({response.status_code}), retry after {retry_after}s")
+                raise RateLimitedError("Add to cart throttled", response.status_code, retry_after)
+            
             else:
                 logger.error(f"Add to cart failed: {response.status_code} - {response.text}")
                 return None
     
+    @staticmethod
+    def cart_request_body(
+        campsite_id: str,
+        facility_id: str,
+        arrival_date: date,
+        departure_date: date
+    ) -> bytes:
+        """Serialized add-to-cart request body"""
+        body = CartAddRequest(
+            campsite_id=campsite_id,
+            facility_id=facility_id,
+            arrival_date=arrival_date.isoformat(),
+            departure_date=departure_date.isoformat()
+        ).to_dict()
+        return dumps_bytes(body)
+    
     async def get_cart(self) -> List[CartItem]:
         """Get current cart contents"""
         async with self.rate_limiter:
             response = await self.client.get(
                 Endpoints.cart(),
-                cookies=self.auth.get_cookies(),
-                headers=self.auth.get_auth_headers()
+                cookies=self.auth_cookies
             )
             
             if response.status_code != 200:
@@ -298,7 +445,7 @@ class RecGovAPIClient:
             
             # Parse cart items
             # Note: actual response structure needs verification
-            data = response.json()
+            data = loads(response.content)
             items = []
             
             for item_data in data.get("items", []):
@@ -322,13 +469,83 @@ class RecGovAPIClient:
     async def clear_cart(self):
         """Remove all items from cart"""
         items = await self.get_cart()
-        for item in items:
-            async with self.rate_limiter:
-                await self.client.delete(
-                    Endpoints.remove_from_cart(item.reservation_id),
-                    cookies=self.auth.get_cookies(),
-                    headers=self.auth.get_auth_headers()
-                )
+        # Deletes are independent: send them together, paced by the rate limiter
+        results = await asyncio.gather(
+            *[self._delete_cart_item(item.reservation_id) for item in items],
+            return_exceptions=True
+        )
+        for item, result in zip(items, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to remove {item.reservation_id} from cart: {result}")
+    
+    async def _delete_cart_item(self, reservation_id: str):
+        async with self.rate_limiter:
+            await self.client.delete(
+                Endpoints.remove_from_cart(reservation_id),
+                cookies=self.auth_cookies
+            )
+    
+    async def _race_add_to_cart(
+        self,
+        site_ids: List[str],
+        target: ReservationTarget,
+        bodies: Dict[str, bytes]
+    ) -> Optional[CartItem]:
+        """
+        Try several sites at once; the first one to land in the cart wins.
+        
+        The remaining requests are cancelled, and any other site that also
+        made it into the cart is removed again. If nothing succeeded, the
+        first AuthenticationError/RateLimitedError is re-raised so the
+        caller re-logs in or backs off once for the whole batch.
+        """
+        tasks = {
+            asyncio.create_task(self.add_to_cart(
+                campsite_id=site_id,
+                facility_id=target.campground_id,
+                arrival_date=target.arrival_date,
+                departure_date=target.departure_date,
+                body_bytes=bodies[site_id]
+            )): site_id
+            for site_id in site_ids
+        }
+        pending = set(tasks)
+        winner: Optional[CartItem] = None
+        extra: List[CartItem] = []
+        error: Optional[Exception] = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        if task.result():
+                            if winner is None:
+                                winner = task.result()
+                            else:
+                                extra.append(task.result())
+                    elif isinstance(exc, (AuthenticationError, RateLimitedError)):
+                        error = error or exc
+                    else:
+                        logger.error(f"Error adding site {tasks[task]}: {exc}")
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        if winner is None:
+            if error is not None:
+                raise error
+            return None
+        
+        # Rare: several sites finished together. Keep one reservation only
+        for item in extra:
+            try:
+                await self._delete_cart_item(item.reservation_id)
+            except Exception as e:
+                logger.error(f"Failed to release extra site {item.campsite.id}: {e}")
+        return winner
     
     # ========================================
     # Main Reservation Flow
@@ -348,7 +565,8 @@ class RecGovAPIClient:
         if retry_strategy is None:
             retry_strategy = RetryStrategy(
                 max_attempts=self.config.retry.max_attempts,
-                base_delay_ms=self.config.retry.attempt_delay_ms
+                base_delay_ms=self.config.retry.attempt_delay_ms,
+                jitter=self.config.retry.jitter
             )
         
         attempt = ReservationAttempt(
@@ -358,13 +576,17 @@ class RecGovAPIClient:
         )
         
         # Determine sites to try
-        sites_to_try = target.campsite_ids.copy() if target.campsite_ids else []
+        sites_to_try = list(target.campsite_ids or ())
+        seen = set(sites_to_try)
         
         # If no specific sites or we should use fallbacks, find available sites
         if not sites_to_try or self.config.retry.use_fallback_sites:
-            available = await self.find_available_sites(target)
+            available = self._take_prewarmed_sites(target)
+            if available is None:
+                available = await self.find_available_sites(target)
             for result in available:
-                if result.campsite.id not in sites_to_try:
+                if result.campsite.id not in seen:
+                    seen.add(result.campsite.id)
                     sites_to_try.append(result.campsite.id)
         
         if not sites_to_try:
@@ -373,19 +595,36 @@ class RecGovAPIClient:
         
         logger.info(f"Attempting reservation for {len(sites_to_try)} sites")
         
+        # Request bodies don't change between retries: serialize them once
+        bodies = {
+            site_id: self.cart_request_body(
+                site_id, target.campground_id, target.arrival_date, target.departure_date
+            )
+            for site_id in sites_to_try
+        }
+        
         # Try each site with retries
         while retry_strategy.should_retry():
             retry_strategy.record_attempt()
             attempt.attempts_made = retry_strategy.attempts
+            retry_after = None
             
-            for site_id in sites_to_try:
+            # Sites are tried `race_width` at a time (1 = one after another)
+            width = max(1, self.config.api.race_width)
+            for i in range(0, len(sites_to_try), width):
+                batch = sites_to_try[i:i + width]
+                login_epoch = self._login_epoch
                 try:
-                    cart_item = await self.add_to_cart(
-                        campsite_id=site_id,
-                        facility_id=target.campground_id,
-                        arrival_date=target.arrival_date,
-                        departure_date=target.departure_date
-                    )
+                    if len(batch) > 1:
+                        cart_item = await self._race_add_to_cart(batch, target, bodies)
+                    else:
+                        cart_item = await self.add_to_cart(
+                            campsite_id=batch[0],
+                            facility_id=target.campground_id,
+                            arrival_date=target.arrival_date,
+                            departure_date=target.departure_date,
+                            body_bytes=bodies[batch[0]]
+                        )
                     
                     if cart_item:
                         attempt.mark_success(
@@ -396,27 +635,81 @@ class RecGovAPIClient:
                     
                 except AuthenticationError:
                     # Try to re-login and continue
-                    await self.login()
+                    await self._relogin(login_epoch)
+                
+                except RateLimitedError as e:
+                    # The other sites would be throttled too: back off now
+                    retry_after = e.retry_after
+                    break
                     
                 except Exception as e:
-                    logger.error(f"Error adding site {site_id}: {e}")
+                    logger.error(f"Error adding sites {batch}: {e}")
             
-            # Wait before retry
+            # Wait before retry, honoring the server's Retry-After if it sent one
             if retry_strategy.should_retry():
-                await retry_strategy.wait()
+                await retry_strategy.wait(retry_after_s=retry_after)
         
         attempt.mark_failed(f"Failed after {attempt.attempts_made} attempts")
         return attempt
 
 
 # CLI interface
-async def main():
-    """CLI entry point"""
-    import click
+async def _amain(config_path: str, command: str):
+    """Run one CLI command on a single event loop and API client"""
     from rich.console import Console
     from rich.table import Table
     
     console = Console()
+    cfg = Config.from_yaml(config_path)
+    target = ReservationTarget(
+        campground_id=cfg.target.campground_id,
+        campsite_ids=cfg.target.campsite_ids,
+        arrival_date=cfg.target.arrival.date(),
+        departure_date=cfg.target.departure.date()
+    )
+    
+    async with RecGovAPIClient(cfg) as client:
+        if command == "check":
+            available = await client.find_available_sites(target)
+            
+            table = Table(title="Available Campsites")
+            table.add_column("Site ID")
+            table.add_column("Name")
+            table.add_column("Loop")
+            table.add_column("Max People")
+            
+            for result in available:
+                table.add_row(
+                    result.campsite.id,
+                    result.campsite.name,
+                    result.campsite.loop or "-",
+                    str(result.campsite.max_people or "-")
+                )
+            
+            console.print(table)
+            return
+        
+        # Login first
+        if not await client.login():
+            console.print("[red]Login failed![/red]")
+            return
+        
+        console.print("[green]Logged in successfully[/green]")
+        console.print(f"Attempting reservation for {target.campground_id}...")
+        
+        result = await client.attempt_reservation(target)
+        
+        if result.status == ReservationStatus.IN_CART:
+            console.print(f"[bold green]SUCCESS![/bold green] Site {result.campsite_secured.name} added to cart!")
+            console.print(f"Checkout URL: {result.checkout_url}")
+            console.print(f"[yellow]Complete checkout within 15 minutes![/yellow]")
+        else:
+            console.print(f"[red]Failed: {result.error_message}[/red]")
+
+
+def main():
+    """CLI entry point"""
+    import click
     
     @click.group()
     def cli():
@@ -427,69 +720,13 @@ async def main():
     @click.option("--config", "-c", default="config/config.yaml", help="Config file path")
     def check(config):
         """Check campsite availability"""
-        async def run():
-            cfg = Config.from_yaml(config)
-            async with RecGovAPIClient(cfg) as client:
-                target = ReservationTarget(
-                    campground_id=cfg.target.campground_id,
-                    campsite_ids=cfg.target.campsite_ids,
-                    arrival_date=cfg.target.arrival.date(),
-                    departure_date=cfg.target.departure.date()
-                )
-                
-                available = await client.find_available_sites(target)
-                
-                table = Table(title="Available Campsites")
-                table.add_column("Site ID")
-                table.add_column("Name")
-                table.add_column("Loop")
-                table.add_column("Max People")
-                
-                for result in available:
-                    table.add_row(
-                        result.campsite.id,
-                        result.campsite.name,
-                        result.campsite.loop or "-",
-                        str(result.campsite.max_people or "-")
-                    )
-                
-                console.print(table)
-        
-        asyncio.run(run())
+        asyncio.run(_amain(config, "check"))
     
     @cli.command()
     @click.option("--config", "-c", default="config/config.yaml", help="Config file path")
     def reserve(config):
         """Attempt to make a reservation"""
-        async def run():
-            cfg = Config.from_yaml(config)
-            async with RecGovAPIClient(cfg) as client:
-                # Login first
-                if not await client.login():
-                    console.print("[red]Login failed![/red]")
-                    return
-                
-                console.print("[green]Logged in successfully[/green]")
-                
-                target = ReservationTarget(
-                    campground_id=cfg.target.campground_id,
-                    campsite_ids=cfg.target.campsite_ids,
-                    arrival_date=cfg.target.arrival.date(),
-                    departure_date=cfg.target.departure.date()
-                )
-                
-                console.print(f"Attempting reservation for {target.campground_id}...")
-                
-                result = await client.attempt_reservation(target)
-                
-                if result.status == ReservationStatus.IN_CART:
-                    console.print(f"[bold green]SUCCESS![/bold green] Site {result.campsite_secured.name} added to cart!")
-                    console.print(f"Checkout URL: {result.checkout_url}")
-                    console.print(f"[yellow]Complete checkout within 15 minutes![/yellow]")
-                else:
-                    console.print(f"[red]Failed: {result.error_message}[/red]")
-        
-        asyncio.run(run())
+        asyncio.run(_amain(config, "reserve"))
     
     cli()
 
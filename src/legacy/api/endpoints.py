@@ -10,10 +10,26 @@ from dataclasses import dataclass
 from typing import Optional
 from urllib.parse import urlencode
 
+from ...common.jsonutil import ACCEPT_ENCODING
+
 
 BASE_URL = "https://www.recreation.gov"
 API_BASE = f"{BASE_URL}/api"
 
+# Fixed endpoints
+LOGIN_URL = f"{API_BASE}/accounts/login"
+LOGOUT_URL = f"{API_BASE}/accounts/logout"
+ACCOUNT_URL = f"{API_BASE}/accounts/account"
+CART_URL = f"{API_BASE}/ticket/cart"
+ADD_TO_CART_URL = f"{API_BASE}/ticket/reservation"
+CHECKOUT_URL = f"{API_BASE}/ticket/checkout"
+CSRF_URL = f"{API_BASE}/csrf"
+
+# Parameterized endpoints, filled with str.__mod__ (cheaper than .format)
+_CAMPGROUND_AVAILABILITY = API_BASE + "/camps/availability/campground/%s/month?start_date=%s"
+_CAMPSITE_AVAILABILITY = API_BASE + "/camps/availability/campsite/%s/month?start_date=%s"
+_REMOVE_FROM_CART = ADD_TO_CART_URL + "/%s"
+
 
 @dataclass
 class Endpoints:
@@ -73,7 +89,7 @@ class Endpoints:
         The start_date should be first of month, e.g., "2025-08-01T00:00:00.000Z"
         Response includes availability status for each campsite for each day.
         """
-        return f"{API_BASE}/camps/availability/campground/{campground_id}/month?start_date={start_date}"
+        return _CAMPGROUND_AVAILABILITY % (campground_id, start_date)
     
     @staticmethod
     def campsite_availability(campsite_id: str, start_date: str) -> str:
@@ -82,7 +98,7 @@ class Endpoints:
         
         GET /api/camps/availability/campsite/{id}/month?start_date={ISO_DATE}
         """
-        return f"{API_BASE}/camps/availability/campsite/{campsite_id}/month?start_date={start_date}"
+        return _CAMPSITE_AVAILABILITY % (campsite_id, start_date)
     
     # ============================================================
     # AUTHENTICATION ENDPOINTS
@@ -98,7 +114,7 @@ class Endpoints:
         
         Returns session cookies and auth token.
         """
-        return f"{API_BASE}/accounts/login"
+        return LOGIN_URL
     
     @staticmethod
     def logout() -> str:
@@ -107,7 +123,7 @@ class Endpoints:
         
         POST /api/accounts/logout
         """
-        return f"{API_BASE}/accounts/logout"
+        return LOGOUT_URL
     
     @staticmethod
     def account_info() -> str:
@@ -116,7 +132,7 @@ class Endpoints:
         
         GET /api/accounts/account
         """
-        return f"{API_BASE}/accounts/account"
+        return ACCOUNT_URL
     
     # ============================================================
     # CART/RESERVATION ENDPOINTS (Auth required)
@@ -129,7 +145,7 @@ class Endpoints:
         
         GET /api/ticket/cart
         """
-        return f"{API_BASE}/ticket/cart"
+        return CART_URL
     
     @staticmethod
     def add_to_cart() -> str:
@@ -150,7 +166,7 @@ class Endpoints:
             ...
         }
         """
-        return f"{API_BASE}/ticket/reservation"
+        return ADD_TO_CART_URL
     
     @staticmethod
     def remove_from_cart(item_id: str) -> str:
@@ -159,7 +175,7 @@ class Endpoints:
         
         DELETE /api/ticket/reservation/{id}
         """
-        return f"{API_BASE}/ticket/reservation/{item_id}"
+        return _REMOVE_FROM_CART % item_id
     
     @staticmethod
     def checkout() -> str:
@@ -168,7 +184,7 @@ class Endpoints:
         
         POST /api/ticket/checkout
         """
-        return f"{API_BASE}/ticket/checkout"
+        return CHECKOUT_URL
     
     # ============================================================
     # UTILITY ENDPOINTS
@@ -190,14 +206,14 @@ class Endpoints:
         
         GET /api/csrf
         """
-        return f"{API_BASE}/csrf"
+        return CSRF_URL
 
 
 # Common request headers to mimic browser
 DEFAULT_HEADERS = {
     "Accept": "application/json, text/plain, */*",
     "Accept-Language": "en-US,en;q=0.9",
-    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Encoding": ACCEPT_ENCODING,
     "Content-Type": "application/json",
     "Origin": "https://www.recreation.gov",
     "Referer": "https://www.recreation.gov/",
@@ -249,7 +265,14 @@ class AvailabilityResponse:
     pass
 
 
-@dataclass  
+# Fields that are the same in every add-to-cart request
+_CART_CONSTANT_FIELDS = {
+    "unitTypeId": 1,  # 1 = STANDARD
+    "inventoryType": "CAMPING",
+}
+
+
+@dataclass(slots=True)
 class CartAddRequest:
     """
     Request body for adding camping reservation to cart.
@@ -271,9 +294,8 @@ class CartAddRequest:
             "departureDate": self.departure_date,
             "numberOfVehicles": self.number_of_vehicles,
             "isOvernightStay": self.is_overnight_stay,
-            # Additional fields that may be required:
-            "unitTypeId": 1,  # 1 = STANDARD
-            "inventoryType": "CAMPING",
+            # Additional fields that may be required
+            **_CART_CONSTANT_FIELDS,
         }
 
 
@@ -27,3 +27,8 @@ def target(config):
         departure_date=config.target.departure.date(),
     )
 
+
+@pytest.fixture()
+def empty_target(target):
+    """Target with no preferred sites, so any available site is tried"""
+    return target.model_copy(update={"campsite_ids": []})
@@ -1,8 +1,11 @@
+import asyncio
+import json
+import time
 import pytest
-from unittest.mock import AsyncMock
-from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from datetime import date, datetime, timedelta, timezone
 
-from src.legacy.api.client import RecGovAPIClient
+from src.legacy.api.client import RecGovAPIClient, RateLimitedError, parse_retry_after
 from src.legacy.api.auth import AuthenticationError
 from src.common.models import (
     Campsite,
@@ -12,24 +15,33 @@ from src.common.models import (
     CartItem,
     ReservationStatus,
 )
+from src.common.config import ScheduleConfig
 from src.common.scheduler import RetryStrategy
 
 
+_EXPIRES_AT = datetime(2030, 8, 1, 12, 15)
+
+
+def _campsite(campsite_id: str, campground_id: str) -> Campsite:
+    return Campsite(id=campsite_id, campground_id=campground_id, name=campsite_id)
+
+
 def _availability_result(campsite_id: str, campground_id: str) -> CampsiteAvailabilityResult:
-    campsite = Campsite(id=campsite_id, campground_id=campground_id, name=campsite_id)
+    campsite = _campsite(campsite_id, campground_id)
     availability = AvailabilitySlot(date=date(2030, 8, 1), status=CampsiteAvailability.AVAILABLE)
     return CampsiteAvailabilityResult(campsite=campsite, availabilities=[availability])
 
+
 def _cart_item(campsite_id: str, campground_id: str) -> CartItem:
     return CartItem(
         reservation_id="test",
-        campsite=Campsite(id=campsite_id, campground_id=campground_id, name=campsite_id),
+        campsite=_campsite(campsite_id, campground_id),
         arrival_date=date(2030, 8, 1),
         departure_date=date(2030, 8, 3),
         subtotal=10.0,
         fees=2.0,
         total=12.0,
-        expires_at=datetime.now() + timedelta(minutes=15),
+        expires_at=_EXPIRES_AT,
     )
 
 
@@ -47,9 +59,7 @@ async def test_api_attempt_reservation_success_first_site(config, target):
 
 
 @pytest.mark.asyncio
-async def test_api_attempt_reservation_uses_fallback_sites(config, target):
-    config.target.campsite_ids = []
-    target.campsite_ids = []
+async def test_api_attempt_reservation_uses_fallback_sites(config, empty_target):
     available = [
         _availability_result("X1", config.target.campground_id),
         _availability_result("Y2", config.target.campground_id),
@@ -61,7 +71,7 @@ async def test_api_attempt_reservation_uses_fallback_sites(config, target):
             side_effect=[None, _cart_item("Y2", config.target.campground_id)]
         )
 
-        result = await client.attempt_reservation(target, RetryStrategy(max_attempts=1))
+        result = await client.attempt_reservation(empty_target, RetryStrategy(max_attempts=1))
 
         assert result.status == ReservationStatus.IN_CART
         assert client.add_to_cart.call_count == 2
@@ -86,15 +96,372 @@ async def test_api_attempt_reservation_reauth_on_auth_error(config, target):
 
 
 @pytest.mark.asyncio
-async def test_api_attempt_reservation_no_available_sites(config, target):
-    target.campsite_ids = []
-
+async def test_api_attempt_reservation_no_available_sites(config, empty_target):
     async with RecGovAPIClient(config) as client:
         client.find_available_sites = AsyncMock(return_value=[])
         client.add_to_cart = AsyncMock()
 
-        result = await client.attempt_reservation(target, RetryStrategy(max_attempts=1))
+        result = await client.attempt_reservation(empty_target, RetryStrategy(max_attempts=1))
 
         assert result.status == ReservationStatus.FAILED
         client.add_to_cart.assert_not_called()
 
+
+
+@pytest.mark.asyncio
+async def test_find_available_sites_fetches_months_concurrently(config, target):
+    target = target.model_copy(update={
+        "arrival_date": date(2030, 8, 30),
+        "departure_date": date(2030, 9, 2),
+    })
+    in_flight = []
+    peak = 0
+
+    async def fetch(campground_id, month):
+        nonlocal peak
+        in_flight.append(month)
+        peak = max(peak, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(month)
+        days = range(30, 32) if month.month == 8 else range(1, 3)
+        campsite = Campsite(id="A1", campground_id=campground_id, name="A1")
+        return {"A1": CampsiteAvailabilityResult(campsite=campsite, availabilities=[
+            AvailabilitySlot(date=month.replace(day=d), status=CampsiteAvailability.AVAILABLE)
+            for d in days
+        ])}
+
+    async with RecGovAPIClient(config) as client:
+        client.get_campground_availability = fetch
+        available = await client.find_available_sites(target)
+
+    assert peak == 2
+    assert [r.campsite.id for r in available] == ["A1"]
+    dates = [slot.date for slot in available[0].availabilities]
+    assert dates == sorted(dates)
+
+
+@pytest.mark.asyncio
+async def test_find_available_sites_waits_for_all_months_before_raising(config, target):
+    target = target.model_copy(update={
+        "arrival_date": date(2030, 8, 30),
+        "departure_date": date(2030, 9, 2),
+    })
+    finished = []
+
+    async def fetch(campground_id, month):
+        if month.month == 8:
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.01)
+        finished.append(month)
+        return {}
+
+    async with RecGovAPIClient(config) as client:
+        client.get_campground_availability = fetch
+        with pytest.raises(RuntimeError, match="boom"):
+            await client.find_available_sites(target)
+
+    assert finished == [date(2030, 9, 1)]
+
+
+@pytest.mark.asyncio
+async def test_clear_cart_deletes_items_concurrently(config, target):
+    items = [_cart_item(sid, target.campground_id) for sid in ("A1", "B2", "C3")]
+    items = [item.model_copy(update={"reservation_id": f"res-{i}"}) for i, item in enumerate(items)]
+    deleted = []
+    in_flight = []
+    peak = 0
+
+    async def delete(url, **kwargs):
+        nonlocal peak
+        in_flight.append(url)
+        peak = max(peak, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(url)
+        deleted.append(url)
+        if url.endswith("res-1"):
+            raise RuntimeError("boom")
+
+    config.api.requests_per_second = len(items)
+    async with RecGovAPIClient(config) as client:
+        client.get_cart = AsyncMock(return_value=items)
+        client.client.delete = delete
+        await client.clear_cart()
+
+    assert len(deleted) == 3
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_attempt_reservation_serializes_cart_bodies_once(config, target):
+    async with RecGovAPIClient(config) as client:
+        client.find_available_sites = AsyncMock(return_value=[])
+        client.add_to_cart = AsyncMock(return_value=None)
+        strategy = RetryStrategy(max_attempts=2, base_delay_ms=0)
+
+        await client.attempt_reservation(target, strategy)
+
+    bodies = [call.kwargs["body_bytes"] for call in client.add_to_cart.call_args_list]
+    assert len(bodies) == 4
+    # Retries reuse the same pre-serialized body object per site
+    assert bodies[0] is bodies[2] and bodies[1] is bodies[3]
+    assert json.loads(bodies[0])["campsiteId"] == target.campsite_ids[0]
+    assert json.loads(bodies[0])["arrivalDate"] == target.arrival_date.isoformat()
+
+
+@pytest.mark.asyncio
+async def test_get_campground_availability_parses_slots(config):
+    body = {"campsites": {"A1": {
+        "site": "A001",
+        "availabilities": {
+            "2030-08-02T00:00:00Z": "Reserved",
+            "2030-08-01T00:00:00Z": "Available",
+            "2030-08-03T00:00:00Z": "Something New",
+            "garbage": "Available",
+        },
+    }}}
+    response = MagicMock(status_code=200, content=json.dumps(body).encode())
+    response.json.return_value = body
+
+    async with RecGovAPIClient(config) as client:
+        client.client.get = AsyncMock(return_value=response)
+        results = await client.get_campground_availability("232447", date(2030, 8, 1))
+
+    slots = results["A1"].availabilities
+    assert [(s.date, s.status) for s in slots] == [
+        (date(2030, 8, 1), CampsiteAvailability.AVAILABLE),
+        (date(2030, 8, 2), CampsiteAvailability.RESERVED),
+        (date(2030, 8, 3), CampsiteAvailability.NOT_AVAILABLE),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_auth_snapshot_built_once_until_login(config):
+    async with RecGovAPIClient(config) as client:
+        client.auth.session.auth_token = "tok-1"
+        client.auth.session.set_cookies({"sid": "abc"})
+
+        first = client.auth_cookies
+        assert client.auth_cookies is first
+        assert first == {"sid": "abc"}
+        assert client.client.headers["Authorization"] == "Bearer tok-1"
+
+        client.auth.load_session = lambda: None
+        client.auth.login = AsyncMock()
+        client.auth.session.auth_token = None
+        await client.login()
+
+        assert "Authorization" not in client.client.headers
+        assert client.auth_cookies is not first
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("arrival, departure, expected", [
+    (date(2030, 8, 1), date(2030, 8, 3), [date(2030, 8, 1)]),
+    (date(2030, 8, 30), date(2030, 9, 1), [date(2030, 8, 1)]),
+    (date(2030, 12, 30), date(2031, 1, 3), [date(2030, 12, 1), date(2031, 1, 1)]),
+])
+async def test_find_available_sites_fetches_only_months_with_nights(
+    config, target, arrival, departure, expected
+):
+    target = target.model_copy(update={"arrival_date": arrival, "departure_date": departure})
+
+    async with RecGovAPIClient(config) as client:
+        client.get_campground_availability = AsyncMock(return_value={})
+        await client.find_available_sites(target)
+
+    months = [call.args[1] for call in client.get_campground_availability.call_args_list]
+    assert months == expected
+
+
+@pytest.mark.asyncio
+async def test_attempt_reservation_uses_fresh_prewarmed_sites(config, target):
+    available = [_availability_result("X1", target.campground_id)]
+
+    config.schedule = ScheduleConfig(window_opens="2020-01-01 07:00:00")
+
+    async with RecGovAPIClient(config) as client:
+        client.login = AsyncMock(return_value=True)
+        client.find_available_sites = AsyncMock(return_value=available)
+        assert await client.prewarm(target)  # window already open: no wait
+        client.login.assert_called_once()
+        client.find_available_sites.reset_mock()
+        client.add_to_cart = AsyncMock(side_effect=[None, None, _cart_item("X1", target.campground_id)])
+
+        result = await client.attempt_reservation(target, RetryStrategy(max_attempts=1))
+
+        assert result.status == ReservationStatus.IN_CART
+        client.find_available_sites.assert_not_called()
+        assert client._prewarmed_sites is None
+
+
+@pytest.mark.asyncio
+async def test_prewarm_prefetches_early_but_returns_at_window_open(config, target):
+    window = datetime.now(timezone.utc) + timedelta(seconds=0.5)
+    config.schedule = ScheduleConfig(window_opens=window.isoformat(), early_start_ms=0)
+    fetched_at = []
+    added_at = []
+
+    async def find_available_sites(target):
+        fetched_at.append(datetime.now(timezone.utc))
+        return [_availability_result("X1", target.campground_id)]
+
+    async def add_to_cart(**kwargs):
+        added_at.append(datetime.now(timezone.utc))
+        return _cart_item("X1", target.campground_id)
+
+    async with RecGovAPIClient(config) as client:
+        client.login = AsyncMock(return_value=True)
+        client.find_available_sites = find_available_sites
+        client.add_to_cart = add_to_cart
+
+        assert await client.prewarm(target, lead_ms=300)
+        result = await client.attempt_reservation(target, RetryStrategy(max_attempts=1))
+
+    assert result.status == ReservationStatus.IN_CART
+    assert fetched_at[0] < window
+    assert added_at and min(added_at) >= window
+
+
+@pytest.mark.asyncio
+async def test_prewarm_skips_fetch_when_login_fails(config, target):
+    config.schedule = ScheduleConfig(window_opens="2020-01-01 07:00:00")
+
+    async with RecGovAPIClient(config) as client:
+        client.login = AsyncMock(return_value=False)
+        client.find_available_sites = AsyncMock()
+
+        assert await client.prewarm(target) is False
+        client.find_available_sites.assert_not_called()
+        assert client._prewarmed_sites is None
+
+
+@pytest.mark.asyncio
+async def test_attempt_reservation_ignores_stale_prewarm(config, target):
+    async with RecGovAPIClient(config) as client:
+        client.find_available_sites = AsyncMock(return_value=[])
+        client._prewarmed_sites = (
+            time.monotonic() - client.PREWARM_MAX_AGE - 1,
+            target,
+            [_availability_result("X1", target.campground_id)],
+        )
+        client.add_to_cart = AsyncMock(return_value=None)
+
+        await client.attempt_reservation(target, RetryStrategy(max_attempts=1))
+
+        client.find_available_sites.assert_called_once()
+
+
+@pytest.mark.parametrize("header,expected", [
+    ("3", 3.0),
+    (None, None),
+    ("soon", None),
+    ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+])
+def test_parse_retry_after(header, expected):
+    assert parse_retry_after(header) == expected
+
+
+@pytest.mark.asyncio
+async def test_add_to_cart_raises_rate_limited_with_retry_after(config, target):
+    async with RecGovAPIClient(config) as client:
+        client._auth_cookies = {}
+        client.client.post = AsyncMock(
+            return_value=MagicMock(status_code=429, headers={"Retry-After": "2"})
+        )
+
+        with pytest.raises(RateLimitedError) as exc_info:
+            await client.add_to_cart(
+                "A1", target.campground_id, target.arrival_date, target.departure_date
+            )
+
+        assert exc_info.value.retry_after == 2.0
+
+
+@pytest.mark.asyncio
+async def test_attempt_reservation_waits_for_retry_after(config, target):
+    async with RecGovAPIClient(config) as client:
+        client.find_available_sites = AsyncMock(return_value=[])
+        client.add_to_cart = AsyncMock(side_effect=[
+            RateLimitedError("throttled", 429, retry_after=1.5),
+            _cart_item(target.campsite_ids[0], target.campground_id),
+        ])
+        strategy = RetryStrategy(max_attempts=2)
+        strategy.wait = AsyncMock()
+
+        result = await client.attempt_reservation(target, strategy)
+
+        assert result.status == ReservationStatus.IN_CART
+        # Throttling skips the remaining sites and backs off for Retry-After
+        assert client.add_to_cart.call_count == 2
+        strategy.wait.assert_awaited_once_with(retry_after_s=1.5)
+
+
+@pytest.mark.asyncio
+async def test_attempt_reservation_races_sites_and_cancels_losers(config, target):
+    config.api.race_width = 2
+    cancelled = []
+
+    async def add_to_cart(campsite_id, **kwargs):
+        if campsite_id == "A1":
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(campsite_id)
+                raise
+        return _cart_item(campsite_id, target.campground_id)
+
+    async with RecGovAPIClient(config) as client:
+        client.find_available_sites = AsyncMock(return_value=[])
+        client.add_to_cart = add_to_cart
+
+        result = await client.attempt_reservation(target, RetryStrategy(max_attempts=1))
+
+    assert result.status == ReservationStatus.IN_CART
+    assert result.campsite_secured.id == "B2"
+    assert cancelled == ["A1"]
+
+
+@pytest.mark.asyncio
+async def test_race_releases_extra_sites_that_landed_together(config, target):
+    async with RecGovAPIClient(config) as client:
+        client.add_to_cart = AsyncMock(side_effect=[
+            _cart_item("A1", target.campground_id),
+            _cart_item("B2", target.campground_id),
+        ])
+        client._delete_cart_item = AsyncMock()
+        bodies = {"A1": b"{}", "B2": b"{}"}
+
+        winner = await client._race_add_to_cart(["A1", "B2"], target, bodies)
+
+    assert winner.campsite.id in ("A1", "B2")
+    client._delete_cart_item.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_race_relogs_in_once_for_batch_auth_errors(config, target):
+    config.api.race_width = 2
+    async with RecGovAPIClient(config) as client:
+        client.find_available_sites = AsyncMock(return_value=[])
+        client.login = AsyncMock(return_value=True)
+        client.add_to_cart = AsyncMock(side_effect=AuthenticationError("expired"))
+
+        result = await client.attempt_reservation(target, RetryStrategy(max_attempts=1))
+
+    assert result.status == ReservationStatus.FAILED
+    client.login.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_relogins_log_in_once(config):
+    async with RecGovAPIClient(config) as client:
+        async def login():
+            await asyncio.sleep(0.01)
+            return True
+
+        client.login = AsyncMock(side_effect=login)
+        epoch = client._login_epoch
+
+        results = await asyncio.gather(*[client._relogin(epoch) for _ in range(3)])
+
+    assert results == [True, True, True]
+    client.login.assert_called_once()
@@ -3,16 +3,38 @@ Tests for API authentication (src/legacy/api/auth.py)
 """
 import pytest
 import json
-import tempfile
-import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 from src.legacy.api.auth import RecGovAuth, AuthenticationError
 from src.common.models import SessionState
 
 
+_SESSION_JSON = json.dumps({
+    "cookies": {"session_id": "abc123"},
+    "local_storage": {},
+    "csrf_token": "csrf_xyz",
+    "auth_token": "token_123",
+    "logged_in": True,
+    "last_refresh": "2030-08-01T10:00:00"
+})
+
+
+@pytest.fixture
+def auth():
+    return RecGovAuth()
+
+
+@pytest.fixture
+def login_init_mocks():
+    """Home page and CSRF responses that every login starts with"""
+    home = SimpleNamespace(cookies={})
+    csrf = SimpleNamespace(status_code=200, json=lambda: {"csrf": "test_csrf"})
+    return home, csrf
+
+
 class TestAuthenticationError:
     def test_exception_message(self):
         error = AuthenticationError("Test error message")
@@ -20,8 +42,7 @@ class TestAuthenticationError:
 
 
 class TestRecGovAuth:
-    def test_init_without_session_file(self):
-        auth = RecGovAuth()
+    def test_init_without_session_file(self, auth):
         assert auth.session_file is None
         assert isinstance(auth.session, SessionState)
         assert auth.session.logged_in is False
@@ -30,28 +51,23 @@ class TestRecGovAuth:
         auth = RecGovAuth(session_file="/tmp/session.json")
         assert auth.session_file == Path("/tmp/session.json")
 
-    def test_is_logged_in_false_initially(self):
-        auth = RecGovAuth()
+    def test_is_logged_in_false_initially(self, auth):
         assert auth.is_logged_in is False
 
-    def test_is_logged_in_true_when_logged_in(self):
-        auth = RecGovAuth()
+    def test_is_logged_in_true_when_logged_in(self, auth):
         auth.session.logged_in = True
         auth.session.last_refresh = datetime.now()
         assert auth.is_logged_in is True
 
-    def test_is_logged_in_false_when_expired(self):
-        auth = RecGovAuth()
+    def test_is_logged_in_false_when_expired(self, auth):
         auth.session.logged_in = True
         auth.session.last_refresh = datetime.now() - timedelta(hours=2)
         assert auth.is_logged_in is False
 
-    def test_get_cookies_empty(self):
-        auth = RecGovAuth()
+    def test_get_cookies_empty(self, auth):
         assert auth.get_cookies() == {}
 
-    def test_get_cookies_returns_copy(self):
-        auth = RecGovAuth()
+    def test_get_cookies_returns_copy(self, auth):
         auth.session.cookies = {"session_id": "abc123"}
         
         cookies = auth.get_cookies()
@@ -60,32 +76,28 @@ class TestRecGovAuth:
         # Original should not be modified
         assert "new_cookie" not in auth.session.cookies
 
-    def test_get_auth_headers_basic(self):
-        auth = RecGovAuth()
+    def test_get_auth_headers_basic(self, auth):
         headers = auth.get_auth_headers()
         
         assert "Accept" in headers
         assert "Content-Type" in headers
         assert "User-Agent" in headers
 
-    def test_get_auth_headers_with_auth_token(self):
-        auth = RecGovAuth()
+    def test_get_auth_headers_with_auth_token(self, auth):
         auth.session.auth_token = "test_token_123"
         
         headers = auth.get_auth_headers()
         
         assert headers["Authorization"] == "Bearer test_token_123"
 
-    def test_get_auth_headers_with_csrf_token(self):
-        auth = RecGovAuth()
+    def test_get_auth_headers_with_csrf_token(self, auth):
         auth.session.csrf_token = "csrf_xyz"
         
         headers = auth.get_auth_headers()
         
         assert headers["X-CSRF-Token"] == "csrf_xyz"
 
-    def test_get_auth_headers_with_both_tokens(self):
-        auth = RecGovAuth()
+    def test_get_auth_headers_with_both_tokens(self, auth):
         auth.session.auth_token = "test_token_123"
         auth.session.csrf_token = "csrf_xyz"
         
@@ -94,8 +106,7 @@ class TestRecGovAuth:
         assert headers["Authorization"] == "Bearer test_token_123"
         assert headers["X-CSRF-Token"] == "csrf_xyz"
 
-    def test_load_session_no_file(self):
-        auth = RecGovAuth()
+    def test_load_session_no_file(self, auth):
         result = auth.load_session()
         assert result is None
 
@@ -104,62 +115,49 @@ class TestRecGovAuth:
         result = auth.load_session()
         assert result is None
 
-    def test_load_session_success(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            try:
-                data = {
-                    "cookies": {"session_id": "abc123"},
-                    "local_storage": {},
-                    "csrf_token": "csrf_xyz",
-                    "auth_token": "token_123",
-                    "logged_in": True,
-                    "last_refresh": "2030-08-01T10:00:00"
-                }
-                json.dump(data, f)
-                f.flush()
-                
-                auth = RecGovAuth(session_file=f.name)
-                result = auth.load_session()
-                
-                assert result is not None
-                assert result.cookies == {"session_id": "abc123"}
-                assert result.csrf_token == "csrf_xyz"
-                assert result.logged_in is True
-            finally:
-                os.unlink(f.name)
-
-    def test_load_session_invalid_json(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            try:
-                f.write("not valid json")
-                f.flush()
-                
-                auth = RecGovAuth(session_file=f.name)
-                result = auth.load_session()
-                
-                assert result is None
-            finally:
-                os.unlink(f.name)
+    def test_load_session_success(self, tmp_path):
+        path = tmp_path / "session.json"
+        path.write_text(_SESSION_JSON)
+        
+        auth = RecGovAuth(session_file=str(path))
+        result = auth.load_session()
+        
+        assert result is not None
+        assert result.cookies == {"session_id": "abc123"}
+        assert result.csrf_token == "csrf_xyz"
+        assert result.logged_in is True
 
-    @pytest.mark.asyncio
-    async def test_login_success(self):
-        auth = RecGovAuth()
+    def test_save_and_load_session_round_trip(self, tmp_path):
+        path = str(tmp_path / "session.json")
+        auth = RecGovAuth(session_file=path)
+        auth.session.cookies = {"session_id": "abc123"}
+        auth.session.auth_token = "token_123"
+        auth.session.logged_in = True
+        auth.session.last_refresh = datetime(2030, 8, 1, 10, 0, 0)
+        auth._save_session()
         
-        # Mock HTTP responses
-        mock_home_response = MagicMock()
-        mock_home_response.cookies = {}
+        loaded = RecGovAuth(session_file=path).load_session()
         
-        mock_csrf_response = MagicMock()
-        mock_csrf_response.status_code = 200
-        mock_csrf_response.json = MagicMock(return_value={"csrf": "test_csrf"})
+        assert loaded == auth.session
+
+    def test_load_session_invalid_json(self, tmp_path):
+        path = tmp_path / "session.json"
+        path.write_text("not valid json")
         
-        mock_login_response = MagicMock()
-        mock_login_response.status_code = 200
-        mock_login_response.cookies = {"session_id": "abc123"}
-        mock_login_response.json = MagicMock(return_value={"token": "auth_token_123"})
+        auth = RecGovAuth(session_file=str(path))
+        result = auth.load_session()
         
-        mock_account_response = MagicMock()
-        mock_account_response.status_code = 200
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_login_success(self, auth, login_init_mocks):
+        mock_home_response, mock_csrf_response = login_init_mocks
+        mock_login_response = SimpleNamespace(
+            status_code=200,
+            cookies={"session_id": "abc123"},
+            json=lambda: {"token": "auth_token_123"},
+        )
+        mock_account_response = SimpleNamespace(status_code=200)
         
         auth.client.get = AsyncMock(side_effect=[
             mock_home_response,    # _init_session home
@@ -174,84 +172,26 @@ class TestRecGovAuth:
         assert result.auth_token == "auth_token_123"
 
     @pytest.mark.asyncio
-    async def test_login_invalid_credentials(self):
-        auth = RecGovAuth()
-        
-        mock_home_response = MagicMock()
-        mock_home_response.cookies = {}
-        
-        mock_csrf_response = MagicMock()
-        mock_csrf_response.status_code = 200
-        mock_csrf_response.json = MagicMock(return_value={})
-        
-        mock_login_response = MagicMock()
-        mock_login_response.status_code = 401
+    @pytest.mark.parametrize("status, match", [
+        (401, "Invalid email or password"),
+        (429, "Rate limited"),
+        (500, "500"),
+    ])
+    async def test_login_rejected(self, auth, login_init_mocks, status, match):
+        mock_home_response, mock_csrf_response = login_init_mocks
+        mock_login_response = SimpleNamespace(status_code=status, text="error")
         
         auth.client.get = AsyncMock(side_effect=[mock_home_response, mock_csrf_response])
         auth.client.post = AsyncMock(return_value=mock_login_response)
         
-        with pytest.raises(AuthenticationError, match="Invalid email or password"):
-            await auth.login("test@example.com", "wrong_password")
-
-    @pytest.mark.asyncio
-    async def test_login_rate_limited(self):
-        auth = RecGovAuth()
-        
-        mock_home_response = MagicMock()
-        mock_home_response.cookies = {}
-        
-        mock_csrf_response = MagicMock()
-        mock_csrf_response.status_code = 200
-        mock_csrf_response.json = MagicMock(return_value={})
-        
-        mock_login_response = MagicMock()
-        mock_login_response.status_code = 429
-        
-        auth.client.get = AsyncMock(side_effect=[mock_home_response, mock_csrf_response])
-        auth.client.post = AsyncMock(return_value=mock_login_response)
-        
-        with pytest.raises(AuthenticationError, match="Rate limited"):
+        with pytest.raises(AuthenticationError, match=match):
             await auth.login("test@example.com", "password")
 
     @pytest.mark.asyncio
-    async def test_login_other_error(self):
-        auth = RecGovAuth()
-        
-        mock_home_response = MagicMock()
-        mock_home_response.cookies = {}
-        
-        mock_csrf_response = MagicMock()
-        mock_csrf_response.status_code = 200
-        mock_csrf_response.json = MagicMock(return_value={})
-        
-        mock_login_response = MagicMock()
-        mock_login_response.status_code = 500
-        mock_login_response.text = "Internal Server Error"
-        
-        auth.client.get = AsyncMock(side_effect=[mock_home_response, mock_csrf_response])
-        auth.client.post = AsyncMock(return_value=mock_login_response)
-        
-        with pytest.raises(AuthenticationError, match="500"):
-            await auth.login("test@example.com", "password")
-
-    @pytest.mark.asyncio
-    async def test_login_verification_failed(self):
-        auth = RecGovAuth()
-        
-        mock_home_response = MagicMock()
-        mock_home_response.cookies = {}
-        
-        mock_csrf_response = MagicMock()
-        mock_csrf_response.status_code = 200
-        mock_csrf_response.json = MagicMock(return_value={})
-        
-        mock_login_response = MagicMock()
-        mock_login_response.status_code = 200
-        mock_login_response.cookies = {"session_id": "abc123"}
-        mock_login_response.json = MagicMock(return_value={})
-        
-        mock_account_response = MagicMock()
-        mock_account_response.status_code = 401  # Verification fails
+    async def test_login_verification_failed(self, auth, login_init_mocks):
+        mock_home_response, mock_csrf_response = login_init_mocks
+        mock_login_response = SimpleNamespace(status_code=200, cookies={"session_id": "abc123"}, json=lambda: {})
+        mock_account_response = SimpleNamespace(status_code=401)  # Verification fails
         
         auth.client.get = AsyncMock(side_effect=[
             mock_home_response,
@@ -264,12 +204,10 @@ class TestRecGovAuth:
             await auth.login("test@example.com", "password")
 
     @pytest.mark.asyncio
-    async def test_refresh_session_success(self):
-        auth = RecGovAuth()
+    async def test_refresh_session_success(self, auth):
         auth.session.cookies = {"session_id": "abc123"}
         
-        mock_response = MagicMock()
-        mock_response.cookies = {"session_id": "refreshed123"}
+        mock_response = SimpleNamespace(cookies={"session_id": "refreshed123"})
         
         auth.client.get = AsyncMock(return_value=mock_response)
         
@@ -280,8 +218,7 @@ class TestRecGovAuth:
         assert auth.session.last_refresh is not None
 
     @pytest.mark.asyncio
-    async def test_refresh_session_failure(self):
-        auth = RecGovAuth()
+    async def test_refresh_session_failure(self, auth):
         auth.session.cookies = {"session_id": "abc123"}
         
         auth.client.get = AsyncMock(side_effect=Exception("Network error"))
@@ -291,8 +228,7 @@ class TestRecGovAuth:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_logout(self):
-        auth = RecGovAuth()
+    async def test_logout(self, auth):
         auth.session.cookies = {"session_id": "abc123"}
         auth.session.logged_in = True
         
@@ -304,21 +240,17 @@ class TestRecGovAuth:
         assert auth.session.cookies == {}
 
     @pytest.mark.asyncio
-    async def test_logout_deletes_session_file(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            try:
-                f.write("{}")
-                f.flush()
-                
-                auth = RecGovAuth(session_file=f.name)
-                auth.session.logged_in = True
-                auth.client.post = AsyncMock()
-                
-                await auth.logout()
-                
-                assert not Path(f.name).exists()
-            except FileNotFoundError:
-                pass  # File was deleted as expected
+    async def test_logout_deletes_session_file(self, tmp_path):
+        path = tmp_path / "session.json"
+        path.write_text("{}")
+        
+        auth = RecGovAuth(session_file=str(path))
+        auth.session.logged_in = True
+        auth.client.post = AsyncMock()
+        
+        await auth.logout()
+        
+        assert not path.exists()
 
     @pytest.mark.asyncio
     async def test_context_manager(self):
@@ -326,12 +258,10 @@ class TestRecGovAuth:
             assert isinstance(auth, RecGovAuth)
 
     @pytest.mark.asyncio
-    async def test_verify_login_success(self):
-        auth = RecGovAuth()
+    async def test_verify_login_success(self, auth):
         auth.session.cookies = {"session_id": "abc123"}
         
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+        mock_response = SimpleNamespace(status_code=200)
         
         auth.client.get = AsyncMock(return_value=mock_response)
         
@@ -340,12 +270,10 @@ class TestRecGovAuth:
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_verify_login_failure(self):
-        auth = RecGovAuth()
+    async def test_verify_login_failure(self, auth):
         auth.session.cookies = {"session_id": "abc123"}
         
-        mock_response = MagicMock()
-        mock_response.status_code = 401
+        mock_response = SimpleNamespace(status_code=401)
         
         auth.client.get = AsyncMock(return_value=mock_response)
         
@@ -354,9 +282,7 @@ class TestRecGovAuth:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_verify_login_exception(self):
-        auth = RecGovAuth()
-        
+    async def test_verify_login_exception(self, auth):
         auth.client.get = AsyncMock(side_effect=Exception("Network error"))
         
         result = await auth._verify_login()
@@ -0,0 +1,152 @@
+"""
+Tests for browser bot helpers (src/browser/bot.py)
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.browser.bot import RecGovBrowserBot
+
+
+@pytest.fixture
+def bot(config, monkeypatch):
+    monkeypatch.setattr("src.browser.bot.asyncio.sleep", AsyncMock())
+    bot = RecGovBrowserBot(config)
+    bot.page = MagicMock()
+    return bot
+
+
+class TestFindAvailableSites:
+    @pytest.mark.asyncio
+    async def test_reads_grid_in_single_round_trip(self, bot, target):
+        bot.navigate_to_availability = AsyncMock()
+        bot.page.eval_on_selector_all = AsyncMock(return_value=[
+            ["111", None],
+            [None, "/camping/campsites/222"],
+            ["111", "/camping/campsites/111"],
+            [None, "/camping/campgrounds/100"],
+        ])
+
+        sites = await bot.find_available_sites(
+            target.campground_id, target.arrival_date, target.departure_date
+        )
+
+        assert sites == ["111", "222"]
+        bot.page.eval_on_selector_all.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_on_error(self, bot, target):
+        bot.navigate_to_availability = AsyncMock()
+        bot.page.eval_on_selector_all = AsyncMock(side_effect=Exception("detached"))
+
+        sites = await bot.find_available_sites(
+            target.campground_id, target.arrival_date, target.departure_date
+        )
+
+        assert sites == []
+
+
+class TestRaceMode:
+    @pytest.mark.asyncio
+    async def test_race_mode_disables_slow_mo(self, config, monkeypatch):
+        playwright = MagicMock()
+        playwright.chromium.launch = AsyncMock()
+        starter = MagicMock()
+        starter.start = AsyncMock(return_value=playwright)
+        monkeypatch.setattr("src.browser.bot.async_playwright", lambda: starter)
+        config.browser.save_session = False
+
+        bot = RecGovBrowserBot(config, race_mode=True)
+        await bot.start()
+
+        assert config.browser.slow_mo > 0
+        assert playwright.chromium.launch.call_args.kwargs["slow_mo"] == 0
+
+
+class TestRaceSites:
+    @pytest.mark.asyncio
+    async def test_first_success_cancels_others(self, bot, target):
+        cancelled = []
+
+        async def try_site(site_id, arrival, departure):
+            if site_id == "fast":
+                return True
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(site_id)
+                raise
+
+        bot._add_to_cart_in_new_tab = try_site
+
+        winner = await bot._race_sites(
+            ["slow", "fast"], target.arrival_date, target.departure_date
+        )
+
+        assert winner == "fast"
+        assert cancelled == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_all_fail(self, bot, target):
+        async def try_site(site_id, arrival, departure):
+            if site_id == "boom":
+                raise RuntimeError("tab crashed")
+            return False
+
+        bot._add_to_cart_in_new_tab = try_site
+
+        winner = await bot._race_sites(
+            ["a", "boom", "b"], target.arrival_date, target.departure_date
+        )
+
+        assert winner is None
+
+    @pytest.mark.asyncio
+    async def test_attempt_reservation_races_in_batches(self, bot, target):
+        bot.config.browser.parallel_tabs = 2
+        bot.config.retry.use_fallback_sites = False
+        bot._is_logged_in = AsyncMock(return_value=True)
+        bot.session = MagicMock(capture_from_page=AsyncMock())
+        bot.add_to_cart = AsyncMock()
+        bot._race_sites = AsyncMock(side_effect=[None, "333"])
+        target = target.model_copy(update={"campsite_ids": ["111", "222", "333"]})
+
+        attempt = await bot.attempt_reservation(target)
+
+        assert attempt.campsite_secured.id == "333"
+        bot._race_sites.assert_called_once()
+        bot.add_to_cart.assert_called_once()
+
+
+class TestDebugScreenshot:
+    @pytest.mark.asyncio
+    async def test_tab_screenshots_are_named_per_site(self, bot):
+        bot.page.screenshot = AsyncMock()
+        tab = MagicMock()
+        tab.screenshot = AsyncMock()
+
+        await bot._debug_screenshot(bot.page, "no_button", "A1")
+        await bot._debug_screenshot(tab, "no_button", "A1")
+
+        bot.page.screenshot.assert_awaited_once_with(path="no_button.png")
+        tab.screenshot.assert_awaited_once_with(path="no_button_A1.png")
+
+
+class TestGetCartExpiry:
+    @pytest.mark.asyncio
+    async def test_parses_and_reuses_last_value(self, bot):
+        timer = MagicMock()
+        timer.text_content = AsyncMock(side_effect=["14:32", "14:32", "9 minutes"])
+        bot.page.query_selector = AsyncMock(return_value=timer)
+
+        assert await bot.get_cart_expiry() == 14 * 60 + 32
+        assert await bot.get_cart_expiry() == 14 * 60 + 32
+        assert bot._last_timer_text == "14:32"
+        assert await bot.get_cart_expiry() == 9 * 60
+
+    @pytest.mark.asyncio
+    async def test_returns_none_without_timer(self, bot):
+        bot.page.query_selector = AsyncMock(return_value=None)
+
+        assert await bot.get_cart_expiry() is None
@@ -9,9 +9,9 @@ from src.common.models import ReservationAttempt, ReservationStatus
 
 
 async def _idle_loop():
+    # Park until cancelled, without scheduling timers
     try:
-        while True:
-            await asyncio.sleep(1)
+        await asyncio.Event().wait()
     except asyncio.CancelledError:
         return
 
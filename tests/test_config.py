@@ -8,7 +8,9 @@ from pathlib import Path
 from datetime import datetime, timedelta
 
 import pytz
+from pydantic import ValidationError
 
+from src.common import config as config_module
 from src.common.config import (
     Config,
     CredentialsConfig,
@@ -82,6 +84,26 @@ class TestTargetConfig:
         assert departure.month == 8
         assert departure.day == 17
 
+    def test_dates_parsed_once_and_refreshed_on_change(self):
+        target = TargetConfig(
+            campground_id="12345",
+            arrival_date="2030-08-15",
+            departure_date="August 17, 2030",
+        )
+        assert target.arrival is target.arrival
+        assert target.departure.day == 17
+        
+        target.arrival_date = "2030-08-16"
+        assert target.arrival.day == 16
+
+    def test_invalid_date_rejected(self):
+        with pytest.raises(ValidationError):
+            TargetConfig(
+                campground_id="12345",
+                arrival_date="not a date",
+                departure_date="2030-08-17",
+            )
+
     def test_optional_equipment(self):
         target = TargetConfig(
             campground_id="12345",
@@ -131,6 +153,30 @@ class TestScheduleConfig:
         assert prep_dt < window_dt
         assert (window_dt - prep_dt).total_seconds() == 300
 
+    def test_window_datetime_cached_until_changed(self):
+        schedule = ScheduleConfig(
+            window_opens="2030-08-01T07:00:00",
+            timezone="UTC",
+        )
+        assert schedule.window_datetime is schedule.window_datetime
+        
+        schedule.window_opens = "Aug 2 2030 8:30 AM"
+        assert schedule.window_datetime.day == 2
+        assert schedule.window_datetime.hour == 8
+        assert schedule.window_datetime.minute == 30
+
+    def test_times_resolved_at_load(self):
+        schedule = ScheduleConfig(window_opens="2030-08-01 07:00:00", prep_time=60)
+        assert schedule._resolved is not None
+        assert schedule.prep_datetime == schedule.window_datetime - timedelta(seconds=60)
+        
+        schedule.prep_time = 120
+        assert schedule.prep_datetime == schedule.window_datetime - timedelta(seconds=120)
+
+    def test_invalid_window_rejected(self):
+        with pytest.raises(ValidationError):
+            ScheduleConfig(window_opens="not a time")
+
     def test_custom_early_start_ms(self):
         schedule = ScheduleConfig(
             window_opens="2030-08-01 07:00:00",
@@ -267,17 +313,48 @@ schedule:
             finally:
                 os.unlink(f.name)
 
+    def test_from_yaml_reparses_only_changed_files(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.yaml"
+        content = """
+credentials:
+  email: test@example.com
+  password: secret123
+target:
+  campground_id: "12345"
+  arrival_date: "2030-08-01"
+  departure_date: "2030-08-03"
+"""
+        path.write_text(content)
+        calls = []
+        real_load = config_module.yaml.load
+        monkeypatch.setattr(
+            config_module.yaml, "load", lambda *a, **k: calls.append(1) or real_load(*a, **k)
+        )
+
+        first = Config.from_yaml(path)
+        second = Config.from_yaml(path)
+        assert len(calls) == 1
+        # Each load still gets its own models
+        assert first is not second and first.target is not second.target
+
+        path.write_text(content.replace("12345", "67890"))
+        assert Config.from_yaml(path).target.campground_id == "67890"
+        assert len(calls) == 2
+
     def test_from_env(self, monkeypatch):
         monkeypatch.setenv("RECGOV_EMAIL", "env@example.com")
         monkeypatch.setenv("RECGOV_PASSWORD", "envpassword")
         monkeypatch.setenv("RECGOV_CAMPGROUND_ID", "67890")
         monkeypatch.setenv("RECGOV_ARRIVAL_DATE", "2030-09-01")
         monkeypatch.setenv("RECGOV_DEPARTURE_DATE", "2030-09-03")
+        monkeypatch.delenv("RECGOV_CAMPSITE_IDS", raising=False)
 
         config = Config.from_env()
         assert config.credentials.email == "env@example.com"
         assert config.credentials.password == "envpassword"
         assert config.target.campground_id == "67890"
+        # No preferred sites means an empty list, not [""]
+        assert config.target.campsite_ids == []
 
     def test_from_env_with_campsite_ids(self, monkeypatch):
         monkeypatch.setenv("RECGOV_EMAIL", "env@example.com")
@@ -144,6 +144,10 @@ class TestCartAddRequest:
         assert request.number_of_vehicles == 2
         assert request.is_overnight_stay is False
 
+    def test_request_uses_slots(self):
+        request = CartAddRequest("12345", "232447", "2030-08-15", "2030-08-17")
+        assert not hasattr(request, "__dict__")
+
     def test_to_dict(self):
         request = CartAddRequest(
             campsite_id="12345",
@@ -0,0 +1,45 @@
+"""
+Tests for shared JSON helpers (src/common/jsonutil.py)
+"""
+import json
+from datetime import date
+from importlib.util import find_spec
+
+import pytest
+
+from src.common import jsonutil
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonutil, "orjson", None)
+    elif jsonutil.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestJsonUtil:
+    def test_dumps_bytes_is_compact_json(self, backend):
+        raw = jsonutil.dumps_bytes({"a": [1, 2], "b": "é"})
+        assert isinstance(raw, bytes)
+        assert b" " not in raw
+        assert json.loads(raw) == {"a": [1, 2], "b": "é"}
+
+    def test_dumps_bytes_uses_default(self, backend):
+        raw = jsonutil.dumps_bytes({"d": date(2030, 8, 1)}, default=str)
+        assert jsonutil.loads(raw) == {"d": "2030-08-01"}
+
+    def test_loads_accepts_bytes_and_str(self, backend):
+        assert jsonutil.loads(b'{"x": 1}') == {"x": 1}
+        assert jsonutil.loads('{"x": 1}') == {"x": 1}
+
+
+def test_accept_encoding_only_lists_decodable_encodings():
+    expected = ["gzip", "deflate"]
+    if find_spec("brotli") or find_spec("brotlicffi"):
+        expected.append("br")
+    if find_spec("zstandard"):
+        expected.append("zstd")
+
+    assert jsonutil.ACCEPT_ENCODING.split(", ") == expected
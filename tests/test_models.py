@@ -83,6 +83,15 @@ class TestCampsite:
         )
         assert campsite.url == "https://www.recreation.gov/camping/campsites/99999"
 
+    def test_copied_models_build_url_from_new_id(self):
+        campsite = Campsite(id="1", campground_id="12345", name="A001")
+        assert campsite.url.endswith("/campsites/1")
+        assert campsite.model_copy(update={"id": "2"}).url.endswith("/campsites/2")
+
+        campground = Campground(id="1", name="Camp")
+        assert campground.url.endswith("/campgrounds/1")
+        assert campground.model_copy(update={"id": "2"}).url.endswith("/campgrounds/2")
+
     def test_campsite_with_optional_fields(self):
         campsite = Campsite(
             id="1001",
@@ -97,6 +106,12 @@ class TestCampsite:
         assert campsite.max_people == 6
         assert campsite.loop == "Loop A"
 
+    def test_campsite_is_frozen_and_hashable(self):
+        campsite = Campsite(id="1001", campground_id="12345", name="A001")
+        with pytest.raises(ValueError):
+            campsite.name = "B002"
+        assert {campsite, Campsite(id="1001", campground_id="12345", name="A001")} == {campsite}
+
 
 class TestAvailabilitySlot:
     def test_create_availability_slot(self):
@@ -278,6 +293,34 @@ class TestReservationTarget:
         params = target.to_api_params()
         assert params["occupants"] == 2
 
+    def test_target_is_frozen_and_params_read_only(self):
+        target = ReservationTarget(
+            campground_id="12345",
+            arrival_date=date(2030, 8, 1),
+            departure_date=date(2030, 8, 3),
+        )
+        with pytest.raises(ValueError):
+            target.num_people = 4
+        params = target.to_api_params()
+        assert params is target.to_api_params()
+        with pytest.raises(TypeError):
+            params["occupants"] = 4
+
+    def test_copied_target_recomputes_derived_values(self):
+        target = ReservationTarget(
+            campground_id="12345",
+            arrival_date=date(2030, 8, 1),
+            departure_date=date(2030, 8, 3),
+        )
+        assert target.num_nights == 2
+        assert target.api_params["end_date"] == "2030-08-03"
+
+        moved = target.model_copy(update={"departure_date": date(2030, 8, 10)})
+
+        assert moved.num_nights == 9
+        assert moved.api_params["end_date"] == "2030-08-10"
+        assert target.api_params["end_date"] == "2030-08-03"
+
 
 class TestCartItem:
     def test_create_cart_item(self):
@@ -398,6 +441,24 @@ class TestSessionState:
         assert "csrf_token=xyz789" in header
         assert "; " in header or header.count("=") == 2
 
+    def test_cookie_header_follows_cookie_changes(self):
+        state = SessionState(cookies={"session_id": "abc123"})
+        assert state.to_cookie_header() == "session_id=abc123"
+        
+        state.update_cookies({"session_id": "refreshed"})
+        assert state.to_cookie_header() == "session_id=refreshed"
+        
+        state.set_cookies({"other": "1"})
+        assert state.to_cookie_header() == "other=1"
+        assert state == SessionState(cookies={"other": "1"})
+        
+        # Direct reassignment and same-size in-place edits show up too
+        state.cookies = {"b": "2"}
+        state.cookies = {"c": "3"}
+        assert state.to_cookie_header() == "c=3"
+        state.cookies["c"] = "4"
+        assert state.to_cookie_header() == "c=4"
+
     def test_is_expired_no_refresh(self):
         state = SessionState()
         assert state.is_expired() is True
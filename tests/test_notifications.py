@@ -1,7 +1,10 @@
 """
 Tests for notification services (src/common/notifications.py)
 """
+import asyncio
+import json
 import pytest
+import httpx
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, date, timedelta
 
@@ -105,6 +108,20 @@ class TestEmailNotifier:
         assert result is True
         notifier.client.post.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_send_reuses_prebuilt_headers(self):
+        notifier = EmailNotifier(api_key="SG.test_key", to_address="user@example.com")
+        notifier.client.post = AsyncMock(return_value=MagicMock(status_code=202))
+        payload = NotificationPayload(title="Test", message="Test message")
+        
+        await notifier.send(payload)
+        await notifier.send(payload)
+        
+        first, second = notifier.client.post.call_args_list
+        assert first.kwargs["headers"] is second.kwargs["headers"]
+        assert first.kwargs["headers"]["Authorization"] == "Bearer SG.test_key"
+        assert first.args[0] == "https://api.sendgrid.com/v3/mail/send"
+
     @pytest.mark.asyncio
     async def test_send_failure(self):
         notifier = EmailNotifier(
@@ -301,7 +318,8 @@ class TestWebhookNotifier:
         assert result is True
         # Check that the URL was included in the request
         call_args = notifier.client.post.call_args
-        json_body = call_args[1]["json"]
+        json_body = json.loads(call_args[1]["content"])
+        assert call_args[1]["headers"]["Content-Type"] == "application/json"
         assert any("https://example.com/cart" in str(block) for block in json_body["blocks"])
 
     @pytest.mark.asyncio
@@ -407,6 +425,30 @@ class TestNotificationManager:
         
         # Console + Email + SMS + Webhook = 4
         assert len(manager.providers) == 4
+        # HTTP providers share the manager's client
+        assert all(p.client is manager.client for p in manager.providers[1:])
+
+    @pytest.mark.asyncio
+    async def test_prewarm_dials_each_provider_host_once(self):
+        config = NotificationsConfig(
+            email=EmailConfig(enabled=True, address="user@example.com", sendgrid_api_key="SG.test"),
+            webhook=WebhookConfig(enabled=True, url="https://hooks.slack.com/services/xxx"),
+        )
+        manager = NotificationManager(config)
+        manager.client.head = AsyncMock(side_effect=[MagicMock(), Exception("refused")])
+        
+        await manager.prewarm()
+        
+        dialed = sorted(call.args[0] for call in manager.client.head.call_args_list)
+        assert dialed == ["https://api.sendgrid.com/", "https://hooks.slack.com/"]
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_shared_client(self):
+        manager = NotificationManager(NotificationsConfig())
+        
+        await manager.aclose()
+        
+        assert manager.client.is_closed
 
     @pytest.mark.asyncio
     async def test_notify_success(self, target):
@@ -434,6 +476,7 @@ class TestNotificationManager:
         attempt.mark_success(campsite, cart_item)
         
         await manager.notify_success(attempt)
+        await manager.drain()
         
         mock_provider.send.assert_called_once()
         call_args = mock_provider.send.call_args[0][0]
@@ -453,6 +496,7 @@ class TestNotificationManager:
         attempt.mark_failed("No sites available")
         
         await manager.notify_failure(attempt)
+        await manager.drain()
         
         mock_provider.send.assert_called_once()
         call_args = mock_provider.send.call_args[0][0]
@@ -469,6 +513,7 @@ class TestNotificationManager:
         manager.providers = [mock_provider]
         
         await manager.notify_captcha("https://example.com/captcha")
+        await manager.drain()
         
         mock_provider.send.assert_called_once()
         call_args = mock_provider.send.call_args[0][0]
@@ -487,11 +532,62 @@ class TestNotificationManager:
         attempt = ReservationAttempt(target=target)
         
         await manager.notify_starting(attempt)
+        await manager.drain()
         
         mock_provider.send.assert_called_once()
         call_args = mock_provider.send.call_args[0][0]
         assert "Starting" in call_args.title
 
+    @pytest.mark.asyncio
+    async def test_notify_returns_before_providers_finish(self):
+        manager = NotificationManager(NotificationsConfig())
+        release = asyncio.Event()
+        sent = []
+        
+        async def slow_send(payload):
+            await release.wait()
+            sent.append(payload.title)
+            return True
+        
+        provider = MagicMock()
+        provider.send = slow_send
+        manager.providers = [provider]
+        
+        await manager.notify_captcha("https://example.com/captcha")
+        assert sent == []
+        assert len(manager._bg_tasks) == 1
+        
+        release.set()
+        await manager.aclose()
+        
+        assert sent == ["🤖 CAPTCHA Required"]
+        assert not manager._bg_tasks
+
+    @pytest.mark.asyncio
+    async def test_duplicate_notifications_are_debounced(self, target):
+        manager = NotificationManager(NotificationsConfig())
+        provider = MagicMock()
+        provider.send = AsyncMock(return_value=True)
+        manager.providers = [provider]
+        attempt = ReservationAttempt(target=target)
+        
+        await manager.notify_starting(attempt)
+        await manager.notify_starting(attempt)
+        await manager.drain()
+        assert provider.send.call_count == 1
+        
+        # Urgent notifications are never dropped
+        await manager.notify_captcha("https://example.com/captcha")
+        await manager.notify_captcha("https://example.com/captcha")
+        await manager.drain()
+        assert provider.send.call_count == 3
+        
+        # Outside the window the message goes out again
+        manager.debounce_window = 0
+        await manager.notify_starting(attempt)
+        await manager.drain()
+        assert provider.send.call_count == 4
+
     @pytest.mark.asyncio
     async def test_send_all_handles_mixed_results(self, target):
         config = NotificationsConfig()
@@ -510,9 +606,93 @@ class TestNotificationManager:
         manager.providers = [success_provider, failure_provider, error_provider]
         
         payload = NotificationPayload(title="Test", message="Test")
-        await manager._send_all(payload)
+        await manager._do_send_all(payload)
         
         # All providers should be called despite errors
         success_provider.send.assert_called_once()
         failure_provider.send.assert_called_once()
         error_provider.send.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_send_all_times_out_slow_provider(self, caplog):
+        manager = NotificationManager(NotificationsConfig())
+        manager.send_timeout = 0.01
+        
+        async def stall(payload):
+            await asyncio.sleep(1)
+            return True
+        
+        slow_provider = MagicMock()
+        slow_provider.send = stall
+        fast_provider = AsyncMock()
+        fast_provider.send = AsyncMock(return_value=True)
+        manager.providers = [slow_provider, fast_provider]
+        
+        with caplog.at_level("INFO"):
+            await manager._do_send_all(NotificationPayload(title="Test", message="Test"))
+        
+        fast_provider.send.assert_called_once()
+        assert "1/2 successful, 1 timed out" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_console_notifier_runs_before_remote_sends(self, capsys):
+        manager = NotificationManager(NotificationsConfig())
+        printed_before_send = []
+        
+        async def send(payload):
+            printed_before_send.append("Test" in capsys.readouterr().out)
+            return True
+        
+        remote = MagicMock()
+        remote.send = send
+        manager.providers.append(remote)
+        
+        await manager._do_send_all(NotificationPayload(title="Test", message="Test"))
+        
+        assert printed_before_send == [True]
+
+    @pytest.mark.asyncio
+    async def test_send_retries_connect_failure_once(self):
+        sms = SMSNotifier(
+            account_sid="AC123",
+            auth_token="token123",
+            from_number="+10987654321",
+            to_number="+11234567890",
+        )
+        sms.client.post = AsyncMock(side_effect=[
+            httpx.ConnectError("refused"),
+            MagicMock(status_code=201),
+        ])
+        
+        result = await sms.send(NotificationPayload(title="Test", message="Test", urgency="high"))
+        
+        assert result is True
+        assert sms.client.post.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_send_does_not_resend_after_request_went_out(self):
+        email = EmailNotifier(api_key="SG.test", to_address="user@example.com")
+        # The provider may already have accepted the message: resending
+        # could deliver it twice
+        email.client.post = AsyncMock(side_effect=httpx.ReadTimeout("slow"))
+        
+        result = await email.send(NotificationPayload(title="Test", message="Test", urgency="high"))
+        
+        assert result is False
+        email.client.post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_send_all_renders_bodies_once(self):
+        manager = NotificationManager(NotificationsConfig())
+        email = EmailNotifier(api_key="SG.test", to_address="user@example.com")
+        webhook = WebhookNotifier(webhook_url="https://hooks.slack.com/services/xxx")
+        email.send = AsyncMock(return_value=True)
+        webhook.send = AsyncMock(return_value=True)
+        manager.providers = [email, webhook]
+        
+        payload = NotificationPayload(title="Test", message="Body", url="https://example.com/cart")
+        await manager._do_send_all(payload)
+        
+        assert "Body" in payload.html_body
+        assert any("https://example.com/cart" in str(block) for block in payload.slack_blocks)
+        assert email._format_html(payload) is payload.html_body
@@ -6,8 +6,6 @@ import asyncio
 import time
 from datetime import datetime, timedelta
 
-import pytz
-
 from src.common.scheduler import PrecisionScheduler, RateLimiter, RetryStrategy
 
 
@@ -21,7 +19,7 @@ class TestPrecisionScheduler:
     def test_now_with_utc(self):
         scheduler = PrecisionScheduler("UTC")
         now = scheduler.now()
-        assert now.tzinfo == pytz.UTC
+        assert now.utcoffset() == timedelta(0)
 
     @pytest.mark.asyncio
     async def test_wait_until_past_time_returns_immediately(self):
@@ -67,6 +65,23 @@ class TestPrecisionScheduler:
         # Should have waited about 50ms (100 - 50), with tolerance
         assert 0.03 <= elapsed <= 0.15
 
+    @pytest.mark.asyncio
+    async def test_wait_until_reanchors_to_wall_clock(self):
+        scheduler = PrecisionScheduler("UTC")
+        scheduler.REANCHOR_INTERVAL = 0.02
+        calls = []
+        original = scheduler._monotonic_deadline
+
+        def tracking_deadline(target):
+            calls.append(target)
+            return original(target)
+
+        scheduler._monotonic_deadline = tracking_deadline
+        reached = await scheduler.wait_until(scheduler.now() + timedelta(milliseconds=700))
+        assert reached is True
+        # Once at entry plus at least one re-anchor during the wait
+        assert len(calls) >= 2
+
     @pytest.mark.asyncio
     async def test_wait_until_localizes_naive_datetime(self):
         scheduler = PrecisionScheduler("UTC")
@@ -130,6 +145,22 @@ class TestPrecisionScheduler:
         # Should work without error and be roughly 5 minutes
         assert 290 <= delta.total_seconds() <= 310
 
+    @pytest.mark.asyncio
+    async def test_prewarm_fires_once_within_lead_time(self):
+        scheduler = PrecisionScheduler("UTC")
+        fired = []
+
+        async def prewarm():
+            fired.append(time.monotonic())
+
+        scheduler.add_prewarm(prewarm, seconds_before=0.05)
+        start = time.monotonic()
+        await scheduler.wait_until(scheduler.now() + timedelta(milliseconds=100))
+        await asyncio.sleep(0)
+
+        assert len(fired) == 1
+        assert fired[0] - start >= 0.03
+
     def test_format_countdown_now_for_past_time(self):
         scheduler = PrecisionScheduler("UTC")
         target = scheduler.now() - timedelta(seconds=5)
@@ -167,6 +198,14 @@ class TestPrecisionScheduler:
         # Allow for timing variance
         assert "h" in countdown
 
+    def test_format_countdown_keeps_zero_units_below_largest(self, monkeypatch):
+        scheduler = PrecisionScheduler("UTC")
+        remaining = timedelta(days=1, minutes=5, seconds=3)
+        monkeypatch.setattr(scheduler, "time_until", lambda target: remaining)
+        assert scheduler.format_countdown(None) == "1d 0h 5m 3s"
+        remaining = timedelta(hours=2, seconds=7)
+        assert scheduler.format_countdown(None) == "2h 0m 7s"
+
 
 class TestRateLimiter:
     @pytest.mark.asyncio
@@ -228,6 +267,43 @@ class TestRateLimiter:
         # Use a conservative threshold for timing-sensitive tests
         assert elapsed >= 0.4
 
+    @pytest.mark.asyncio
+    async def test_context_manager_does_not_hold_across_body(self):
+        limiter = RateLimiter(requests_per_second=5.0)
+        in_body = 0
+        peak = 0
+
+        async def request():
+            nonlocal in_body, peak
+            async with limiter:
+                in_body += 1
+                peak = max(peak, in_body)
+                await asyncio.sleep(0.05)
+                in_body -= 1
+
+        await asyncio.gather(*(request() for _ in range(3)))
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_get_consecutive_slots(self):
+        limiter = RateLimiter(requests_per_second=10.0)
+        limiter.tokens = 0
+        limiter.last_update = time.monotonic()
+        finished = []
+
+        async def worker():
+            await limiter.acquire()
+            finished.append(time.monotonic())
+
+        start = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(3)))
+
+        # Slots at ~0.1s, ~0.2s, ~0.3s: waits overlap instead of stacking
+        # behind the lock, but the rate still holds
+        assert finished[-1] - start >= 0.25
+        assert finished[-1] - start < 0.5
+
     @pytest.mark.asyncio
     async def test_tokens_cap_at_rate(self):
         limiter = RateLimiter(requests_per_second=5.0)
@@ -354,6 +430,57 @@ class TestRetryStrategy:
         # Should be capped at 150ms, not 100 * 2^9 = 51200ms
         assert elapsed < 0.3
 
+    @pytest.mark.asyncio
+    async def test_wait_decorrelated_jitter_stays_in_bounds(self, monkeypatch):
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("src.common.scheduler.asyncio.sleep", fake_sleep)
+        strategy = RetryStrategy(base_delay_ms=100, max_delay_ms=1000, jitter=True)
+
+        prev_ms = 100
+        for _ in range(20):
+            strategy.record_attempt()
+            await strategy.wait()
+            delay_ms = sleeps[-1] * 1000
+            assert 100 <= delay_ms <= min(1000, prev_ms * 3)
+            prev_ms = delay_ms
+
+        strategy.reset()
+        assert strategy._prev_delay_ms == 100
+
+    @pytest.mark.asyncio
+    async def test_wait_honors_retry_after(self, monkeypatch):
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("src.common.scheduler.asyncio.sleep", fake_sleep)
+        strategy = RetryStrategy(base_delay_ms=100, jitter=True)
+        strategy.record_attempt()
+
+        await strategy.wait(retry_after_s=2.5)
+
+        assert sleeps == [2.5]
+        assert strategy._prev_delay_ms == 100
+
+    @pytest.mark.asyncio
+    async def test_wait_caps_retry_after_at_max_delay(self, monkeypatch):
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("src.common.scheduler.asyncio.sleep", fake_sleep)
+        strategy = RetryStrategy(base_delay_ms=100, max_delay_ms=2000)
+
+        await strategy.wait(retry_after_s=3600)
+
+        assert sleeps == [2.0]
+
     def test_reset_clears_attempts(self):
         strategy = RetryStrategy(max_attempts=3)
         strategy.record_attempt()
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
+from src.common import jsonutil
 from src.browser.session import BrowserSession, SessionHandoff
 
 
@@ -26,6 +27,12 @@ class TestBrowserSession:
         session = BrowserSession(session_file="/tmp/test_session.json")
         assert session.session_file == Path("/tmp/test_session.json")
 
+    def test_uses_slots(self):
+        session = BrowserSession()
+        assert not hasattr(session, "__dict__")
+        with pytest.raises(AttributeError):
+            session.unknown = True
+
     def test_save_without_file(self):
         session = BrowserSession()
         session.cookies = [{"name": "test", "value": "value"}]
@@ -101,6 +108,62 @@ class TestBrowserSession:
             finally:
                 os.unlink(f.name)
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_load_round_trip(self, use_orjson, monkeypatch):
+        if not use_orjson:
+            monkeypatch.setattr("src.common.jsonutil.orjson", None)
+        elif jsonutil.orjson is None:
+            pytest.skip("orjson not installed")
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            try:
+                session = BrowserSession(session_file=f.name)
+                session.cookies = [{"name": "test", "value": "value", "expires": 1.5}]
+                session.session_storage = {"tab": "1"}
+                session.logged_in = True
+                session.last_refresh = datetime(2025, 1, 1, 7, 0, 0)
+                session.save()
+                
+                loaded = BrowserSession(session_file=f.name)
+                assert loaded.load() is True
+                assert loaded.cookies == session.cookies
+                assert loaded.session_storage == {"tab": "1"}
+                assert loaded.logged_in is True
+                assert loaded.last_refresh == session.last_refresh
+            finally:
+                os.unlink(f.name)
+
+    def test_msgpack_path_without_msgpack_fails_instead_of_writing_json(self, monkeypatch):
+        monkeypatch.setattr("src.browser.session.msgpack", None)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "session.msgpack"
+            session = BrowserSession(session_file=str(path))
+            session.cookies = [{"name": "test", "value": "value"}]
+            session.save()
+            
+            assert not path.exists()
+            
+            path.write_bytes(b'{"cookies": []}')
+            assert BrowserSession(session_file=str(path)).load() is False
+
+    def test_load_skips_unchanged_file(self):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            try:
+                json.dump({"cookies": [{"name": "a", "value": "1"}]}, f)
+                f.flush()
+                
+                session = BrowserSession(session_file=f.name)
+                assert session.load() is True
+                session.cookies[0]["value"] = "in-memory"
+                
+                assert session.load() is True
+                assert session.cookies[0]["value"] == "in-memory"
+                
+                session.invalidate_cache()
+                assert session.load() is True
+                assert session.cookies[0]["value"] == "1"
+            finally:
+                os.unlink(f.name)
+
     def test_is_expired_no_refresh(self):
         session = BrowserSession()
         assert session.is_expired() is True
@@ -197,6 +260,24 @@ class TestBrowserSession:
         assert ".example.com" in result
         assert "..example.com" not in result
 
+    def test_cookie_exports_follow_cookie_changes(self):
+        session = BrowserSession()
+        session.cookies = [{"name": "session_id", "value": "abc123"}]
+        
+        assert session.to_cookie_string() == "session_id=abc123"
+        session.export_for_requests()["session_id"] = "mutated"
+        assert session.export_for_requests() == {"session_id": "abc123"}
+        
+        session.cookies.append({"name": "csrf_token", "value": "xyz789"})
+        assert session.to_cookie_string() == "session_id=abc123; csrf_token=xyz789"
+        
+        # Reassigned lists and same-size in-place edits show up too
+        session.cookies = [{"name": "a", "value": "1"}]
+        session.cookies = [{"name": "b", "value": "2"}]
+        assert session.to_cookie_string() == "b=2"
+        session.cookies[0]["value"] = "3"
+        assert session.export_for_requests() == {"b": "3"}
+
     def test_export_for_requests_empty(self):
         session = BrowserSession()
         assert session.export_for_requests() == {}
@@ -221,10 +302,10 @@ class TestBrowserSession:
         
         # Mock page and context
         mock_page = AsyncMock()
-        mock_page.evaluate = AsyncMock(side_effect=[
-            {"ls_key": "ls_value"},  # localStorage
-            {"ss_key": "ss_value"},  # sessionStorage
-        ])
+        mock_page.evaluate = AsyncMock(return_value={
+            "local": {"ls_key": "ls_value"},
+            "session": {"ss_key": "ss_value"},
+        })
         
         mock_context = AsyncMock()
         mock_context.cookies = AsyncMock(return_value=[
@@ -238,6 +319,7 @@ class TestBrowserSession:
         assert session.session_storage == {"ss_key": "ss_value"}
         assert session.logged_in is True
         assert session.last_refresh is not None
+        mock_page.evaluate.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_restore_to_context_no_cookies(self):
@@ -261,6 +343,66 @@ class TestBrowserSession:
         assert result is True
         mock_context.add_cookies.assert_called_once_with(session.cookies)
 
+    @pytest.mark.asyncio
+    async def test_restore_to_context_drops_expired_and_duplicates(self):
+        session = BrowserSession()
+        session.cookies = [
+            {"name": "a", "value": "old", "domain": ".recreation.gov", "path": "/", "expires": -1},
+            {"name": "expired", "value": "x", "domain": ".recreation.gov", "path": "/", "expires": 1},
+            {"name": "a", "value": "new", "domain": ".recreation.gov", "path": "/", "expires": -1},
+            {"name": "a", "value": "api", "domain": ".recreation.gov", "path": "/api", "expires": -1},
+        ]
+        
+        mock_context = AsyncMock()
+        
+        result = await session.restore_to_context(mock_context)
+        
+        assert result is True
+        restored = mock_context.add_cookies.call_args.args[0]
+        assert [(c["value"], c["path"]) for c in restored] == [("new", "/"), ("api", "/api")]
+
+    @pytest.mark.asyncio
+    async def test_restore_to_context_all_expired(self):
+        session = BrowserSession()
+        session.cookies = [{"name": "expired", "value": "x", "expires": 1}]
+        
+        mock_context = AsyncMock()
+        
+        result = await session.restore_to_context(mock_context)
+        
+        assert result is False
+        mock_context.add_cookies.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_restore_to_context_skips_navigation_without_storage(self):
+        session = BrowserSession()
+        session.cookies = [{"name": "session", "value": "abc123"}]
+        
+        mock_page = AsyncMock()
+        mock_context = AsyncMock()
+        
+        result = await session.restore_to_context(mock_context, mock_page)
+        
+        assert result is True
+        mock_page.goto.assert_not_called()
+        mock_page.evaluate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_restore_to_context_no_goto_when_on_site(self):
+        session = BrowserSession()
+        session.cookies = [{"name": "session", "value": "abc123"}]
+        session.local_storage = {"ls_key": "ls_value"}
+        
+        mock_page = AsyncMock()
+        mock_page.url = "https://www.recreation.gov/camping/campgrounds/100"
+        mock_context = AsyncMock()
+        
+        result = await session.restore_to_context(mock_context, mock_page)
+        
+        assert result is True
+        mock_page.goto.assert_not_called()
+        mock_page.evaluate.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_restore_to_context_with_storage(self):
         session = BrowserSession()